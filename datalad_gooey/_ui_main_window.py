@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'main_window.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
+    QCursor, QFont, QFontDatabase, QGradient,
+    QIcon, QImage, QKeySequence, QLinearGradient,
+    QPainter, QPalette, QPixmap, QRadialGradient,
+    QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QAbstractItemView, QApplication, QDialogButtonBox,
+    QGridLayout, QHBoxLayout, QHeaderView, QLabel,
+    QMainWindow, QMenu, QMenuBar, QPlainTextEdit,
+    QPushButton, QScrollArea, QSizePolicy, QSpacerItem,
+    QSplitter, QStatusBar, QTabWidget, QTextBrowser,
+    QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget)
+
+from datalad_gooey.history_widget import HistoryWidget
+from datalad_gooey.metadata_widget import MetadataWidget
+from datalad_gooey.property_widget import PropertyWidget
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(891, 730)
+        self.actionCheck_for_new_version = QAction(MainWindow)
+        self.actionCheck_for_new_version.setObjectName(u"actionCheck_for_new_version")
+        self.actionCheck_for_new_version.setEnabled(True)
+        self.action_Quit = QAction(MainWindow)
+        self.action_Quit.setObjectName(u"action_Quit")
+        self.actionViewTheme_system = QAction(MainWindow)
+        self.actionViewTheme_system.setObjectName(u"actionViewTheme_system")
+        self.actionViewTheme_light = QAction(MainWindow)
+        self.actionViewTheme_light.setObjectName(u"actionViewTheme_light")
+        self.actionViewTheme_dark = QAction(MainWindow)
+        self.actionViewTheme_dark.setObjectName(u"actionViewTheme_dark")
+        self.actionReport_a_problem = QAction(MainWindow)
+        self.actionReport_a_problem.setObjectName(u"actionReport_a_problem")
+        self.actionAbout = QAction(MainWindow)
+        self.actionAbout.setObjectName(u"actionAbout")
+        self.actionGetHelp = QAction(MainWindow)
+        self.actionGetHelp.setObjectName(u"actionGetHelp")
+        self.actionDiagnostic_infos = QAction(MainWindow)
+        self.actionDiagnostic_infos.setObjectName(u"actionDiagnostic_infos")
+        self.actionSetBaseDirectory = QAction(MainWindow)
+        self.actionSetBaseDirectory.setObjectName(u"actionSetBaseDirectory")
+        self.actionWaitingToBePopulated = QAction(MainWindow)
+        self.actionWaitingToBePopulated.setObjectName(u"actionWaitingToBePopulated")
+        self.actionManageCredentials = QAction(MainWindow)
+        self.actionManageCredentials.setObjectName(u"actionManageCredentials")
+        self.actionSetAuthorIdentity = QAction(MainWindow)
+        self.actionSetAuthorIdentity.setObjectName(u"actionSetAuthorIdentity")
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.centralwidget.setEnabled(True)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(1)
+        sizePolicy.setHeightForWidth(self.centralwidget.sizePolicy().hasHeightForWidth())
+        self.centralwidget.setSizePolicy(sizePolicy)
+        self.verticalLayout_3 = QVBoxLayout(self.centralwidget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.mainVSplitter = QSplitter(self.centralwidget)
+        self.mainVSplitter.setObjectName(u"mainVSplitter")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.mainVSplitter.sizePolicy().hasHeightForWidth())
+        self.mainVSplitter.setSizePolicy(sizePolicy1)
+        self.mainVSplitter.setOrientation(Qt.Vertical)
+        self.mainHSplitter = QSplitter(self.mainVSplitter)
+        self.mainHSplitter.setObjectName(u"mainHSplitter")
+        self.mainHSplitter.setOrientation(Qt.Horizontal)
+        self.fsBrowser = QTreeWidget(self.mainHSplitter)
+        __qtreewidgetitem = QTreeWidgetItem()
+        __qtreewidgetitem.setText(0, u"1")
+        self.fsBrowser.setHeaderItem(__qtreewidgetitem)
+        self.fsBrowser.setObjectName(u"fsBrowser")
+        self.fsBrowser.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.fsBrowser.setDragEnabled(False)
+        self.fsBrowser.setAlternatingRowColors(True)
+        self.fsBrowser.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.fsBrowser.setSortingEnabled(True)
+        self.mainHSplitter.addWidget(self.fsBrowser)
+        self.contextTabs = QTabWidget(self.mainHSplitter)
+        self.contextTabs.setObjectName(u"contextTabs")
+        self.contextTabs.setEnabled(True)
+        self.cmdTab = QWidget()
+        self.cmdTab.setObjectName(u"cmdTab")
+        self.cmdTabLayout = QVBoxLayout(self.cmdTab)
+        self.cmdTabLayout.setObjectName(u"cmdTabLayout")
+        self.cmdTabTitle = QLabel(self.cmdTab)
+        self.cmdTabTitle.setObjectName(u"cmdTabTitle")
+
+        self.cmdTabLayout.addWidget(self.cmdTabTitle)
+
+        self.cmdTabScrollArea = QScrollArea(self.cmdTab)
+        self.cmdTabScrollArea.setObjectName(u"cmdTabScrollArea")
+        self.cmdTabScrollArea.setWidgetResizable(True)
+        self.cmdTabScrollAreaWidgetContents = QWidget()
+        self.cmdTabScrollAreaWidgetContents.setObjectName(u"cmdTabScrollAreaWidgetContents")
+        self.cmdTabScrollAreaWidgetContents.setEnabled(True)
+        self.cmdTabScrollAreaWidgetContents.setGeometry(QRect(0, 0, 428, 212))
+        self.cmdTabScrollArea.setWidget(self.cmdTabScrollAreaWidgetContents)
+
+        self.cmdTabLayout.addWidget(self.cmdTabScrollArea)
+
+        self.cmdTabButtonBox = QDialogButtonBox(self.cmdTab)
+        self.cmdTabButtonBox.setObjectName(u"cmdTabButtonBox")
+        self.cmdTabButtonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.cmdTabLayout.addWidget(self.cmdTabButtonBox)
+
+        self.contextTabs.addTab(self.cmdTab, "")
+        self.metadataTab = QWidget()
+        self.metadataTab.setObjectName(u"metadataTab")
+        self.verticalLayout_5 = QVBoxLayout(self.metadataTab)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.scrollArea = QScrollArea(self.metadataTab)
+        self.scrollArea.setObjectName(u"scrollArea")
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollAreaWidgetContents = QWidget()
+        self.scrollAreaWidgetContents.setObjectName(u"scrollAreaWidgetContents")
+        self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 428, 263))
+        self.verticalLayout_6 = QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.metadataTabWidget = MetadataWidget(self.scrollAreaWidgetContents)
+        self.metadataTabWidget.setObjectName(u"metadataTabWidget")
+
+        self.verticalLayout_6.addWidget(self.metadataTabWidget)
+
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+
+        self.verticalLayout_5.addWidget(self.scrollArea)
+
+        self.contextTabs.addTab(self.metadataTab, "")
+        self.historyTab = QWidget()
+        self.historyTab.setObjectName(u"historyTab")
+        self.verticalLayout_7 = QVBoxLayout(self.historyTab)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.historyWidget = HistoryWidget(self.historyTab)
+        self.historyWidget.setObjectName(u"historyWidget")
+
+        self.verticalLayout_7.addWidget(self.historyWidget)
+
+        self.contextTabs.addTab(self.historyTab, "")
+        self.propertiesTab = QWidget()
+        self.propertiesTab.setObjectName(u"propertiesTab")
+        self.gridLayout = QGridLayout(self.propertiesTab)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.propertyWidget = PropertyWidget(self.propertiesTab)
+        self.propertyWidget.setObjectName(u"propertyWidget")
+
+        self.gridLayout.addWidget(self.propertyWidget, 0, 0, 1, 1)
+
+        self.contextTabs.addTab(self.propertiesTab, "")
+        self.mainHSplitter.addWidget(self.contextTabs)
+        self.mainVSplitter.addWidget(self.mainHSplitter)
+        self.consoleTabs = QTabWidget(self.mainVSplitter)
+        self.consoleTabs.setObjectName(u"consoleTabs")
+        self.commandLogTab = QWidget()
+        self.commandLogTab.setObjectName(u"commandLogTab")
+        self.verticalLayout_2 = QVBoxLayout(self.commandLogTab)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.commandLog = QPlainTextEdit(self.commandLogTab)
+        self.commandLog.setObjectName(u"commandLog")
+        self.commandLog.setAcceptDrops(False)
+        self.commandLog.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.commandLog.setUndoRedoEnabled(False)
+        self.commandLog.setReadOnly(True)
+        self.commandLog.setPlainText(u"")
+
+        self.verticalLayout_2.addWidget(self.commandLog)
+
+        self.clearCommandLogPB = QPushButton(self.commandLogTab)
+        self.clearCommandLogPB.setObjectName(u"clearCommandLogPB")
+
+        self.verticalLayout_2.addWidget(self.clearCommandLogPB, 0, Qt.AlignRight|Qt.AlignTop)
+
+        self.consoleTabs.addTab(self.commandLogTab, "")
+        self.tabErrorLog = QWidget()
+        self.tabErrorLog.setObjectName(u"tabErrorLog")
+        self.verticalLayout = QVBoxLayout(self.tabErrorLog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.errorLog = QPlainTextEdit(self.tabErrorLog)
+        self.errorLog.setObjectName(u"errorLog")
+        self.errorLog.setAcceptDrops(False)
+        self.errorLog.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.errorLog.setUndoRedoEnabled(False)
+        self.errorLog.setReadOnly(True)
+        self.errorLog.setPlainText(u"")
+
+        self.verticalLayout.addWidget(self.errorLog)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.CopyLogPB = QPushButton(self.tabErrorLog)
+        self.CopyLogPB.setObjectName(u"CopyLogPB")
+
+        self.horizontalLayout.addWidget(self.CopyLogPB)
+
+        self.clearErrorLogPB = QPushButton(self.tabErrorLog)
+        self.clearErrorLogPB.setObjectName(u"clearErrorLogPB")
+
+        self.horizontalLayout.addWidget(self.clearErrorLogPB)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.consoleTabs.addTab(self.tabErrorLog, "")
+        self.helpTab = QWidget()
+        self.helpTab.setObjectName(u"helpTab")
+        self.verticalLayout_4 = QVBoxLayout(self.helpTab)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.helpBrowser = QTextBrowser(self.helpTab)
+        self.helpBrowser.setObjectName(u"helpBrowser")
+
+        self.verticalLayout_4.addWidget(self.helpBrowser)
+
+        self.consoleTabs.addTab(self.helpTab, "")
+        self.mainVSplitter.addWidget(self.consoleTabs)
+
+        self.verticalLayout_3.addWidget(self.mainVSplitter)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QMenuBar(MainWindow)
+        self.menubar.setObjectName(u"menubar")
+        self.menubar.setGeometry(QRect(0, 0, 891, 21))
+        self.menuUtilities = QMenu(self.menubar)
+        self.menuUtilities.setObjectName(u"menuUtilities")
+        self.menuDatalad = QMenu(self.menubar)
+        self.menuDatalad.setObjectName(u"menuDatalad")
+        self.menuFile = QMenu(self.menubar)
+        self.menuFile.setObjectName(u"menuFile")
+        self.menuView = QMenu(self.menubar)
+        self.menuView.setObjectName(u"menuView")
+        self.menuSuite = QMenu(self.menuView)
+        self.menuSuite.setObjectName(u"menuSuite")
+        self.menuTheme = QMenu(self.menuView)
+        self.menuTheme.setObjectName(u"menuTheme")
+        self.menuHelp = QMenu(self.menubar)
+        self.menuHelp.setObjectName(u"menuHelp")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QStatusBar(MainWindow)
+        self.statusbar.setObjectName(u"statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuDatalad.menuAction())
+        self.menubar.addAction(self.menuView.menuAction())
+        self.menubar.addAction(self.menuUtilities.menuAction())
+        self.menubar.addAction(self.menuHelp.menuAction())
+        self.menuUtilities.addAction(self.actionCheck_for_new_version)
+        self.menuUtilities.addAction(self.actionManageCredentials)
+        self.menuUtilities.addAction(self.actionSetAuthorIdentity)
+        self.menuDatalad.addAction(self.actionWaitingToBePopulated)
+        self.menuFile.addAction(self.actionSetBaseDirectory)
+        self.menuFile.addAction(self.action_Quit)
+        self.menuView.addAction(self.menuSuite.menuAction())
+        self.menuView.addAction(self.menuTheme.menuAction())
+        self.menuSuite.addAction(self.actionWaitingToBePopulated)
+        self.menuTheme.addAction(self.actionViewTheme_system)
+        self.menuTheme.addAction(self.actionViewTheme_light)
+        self.menuTheme.addAction(self.actionViewTheme_dark)
+        self.menuHelp.addAction(self.actionGetHelp)
+        self.menuHelp.addAction(self.actionReport_a_problem)
+        self.menuHelp.addAction(self.actionDiagnostic_infos)
+        self.menuHelp.addAction(self.actionAbout)
+
+        self.retranslateUi(MainWindow)
+        self.action_Quit.triggered.connect(MainWindow.close)
+        self.clearCommandLogPB.clicked.connect(self.commandLog.clear)
+        self.clearErrorLogPB.clicked.connect(self.errorLog.clear)
+        self.CopyLogPB.clicked.connect(self.errorLog.selectAll)
+        self.CopyLogPB.clicked.connect(self.errorLog.copy)
+
+        self.contextTabs.setCurrentIndex(0)
+        self.consoleTabs.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"DataLad Gooey", None))
+        self.actionCheck_for_new_version.setText(QCoreApplication.translate("MainWindow", u"Check for new &version", None))
+        self.action_Quit.setText(QCoreApplication.translate("MainWindow", u"&Quit", None))
+        self.actionViewTheme_system.setText(QCoreApplication.translate("MainWindow", u"&System", None))
+        self.actionViewTheme_light.setText(QCoreApplication.translate("MainWindow", u"&Light", None))
+        self.actionViewTheme_dark.setText(QCoreApplication.translate("MainWindow", u"&Dark", None))
+        self.actionReport_a_problem.setText(QCoreApplication.translate("MainWindow", u"&Report a problem", None))
+        self.actionAbout.setText(QCoreApplication.translate("MainWindow", u"&About", None))
+        self.actionGetHelp.setText(QCoreApplication.translate("MainWindow", u"Get &help", None))
+        self.actionDiagnostic_infos.setText(QCoreApplication.translate("MainWindow", u"&Diagnostic infos", None))
+        self.actionSetBaseDirectory.setText(QCoreApplication.translate("MainWindow", u"Set &base directory", None))
+        self.actionWaitingToBePopulated.setText(QCoreApplication.translate("MainWindow", u"Waiting to be populated", None))
+        self.actionManageCredentials.setText(QCoreApplication.translate("MainWindow", u"Manage &credentials", None))
+        self.actionSetAuthorIdentity.setText(QCoreApplication.translate("MainWindow", u"Set author &identity", None))
+        self.cmdTabTitle.setText("")
+        self.contextTabs.setTabText(self.contextTabs.indexOf(self.cmdTab), QCoreApplication.translate("MainWindow", u"Command", None))
+        self.contextTabs.setTabText(self.contextTabs.indexOf(self.metadataTab), QCoreApplication.translate("MainWindow", u"Metadata", None))
+        self.contextTabs.setTabText(self.contextTabs.indexOf(self.historyTab), QCoreApplication.translate("MainWindow", u"History", None))
+        self.contextTabs.setTabText(self.contextTabs.indexOf(self.propertiesTab), QCoreApplication.translate("MainWindow", u"Properties", None))
+        self.clearCommandLogPB.setText(QCoreApplication.translate("MainWindow", u"Clear", None))
+        self.consoleTabs.setTabText(self.consoleTabs.indexOf(self.commandLogTab), QCoreApplication.translate("MainWindow", u"Command log", None))
+#if QT_CONFIG(tooltip)
+        self.tabErrorLog.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>View Tracebacks of failed command executions</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.errorLog.setToolTip(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>View tracebacks of failed commands</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(whatsthis)
+        self.errorLog.setWhatsThis(QCoreApplication.translate("MainWindow", u"<html><head/><body><p>Traceback Viewer for details on failures</p><p><br/></p></body></html>", None))
+#endif // QT_CONFIG(whatsthis)
+        self.CopyLogPB.setText(QCoreApplication.translate("MainWindow", u"Copy", None))
+        self.clearErrorLogPB.setText(QCoreApplication.translate("MainWindow", u"Clear", None))
+        self.consoleTabs.setTabText(self.consoleTabs.indexOf(self.tabErrorLog), QCoreApplication.translate("MainWindow", u"Error log", None))
+        self.consoleTabs.setTabText(self.consoleTabs.indexOf(self.helpTab), QCoreApplication.translate("MainWindow", u"Help", None))
+        self.menuUtilities.setTitle(QCoreApplication.translate("MainWindow", u"&Utilities", None))
+        self.menuDatalad.setTitle(QCoreApplication.translate("MainWindow", u"&DataLad", None))
+        self.menuFile.setTitle(QCoreApplication.translate("MainWindow", u"&File", None))
+        self.menuView.setTitle(QCoreApplication.translate("MainWindow", u"&View", None))
+        self.menuSuite.setTitle(QCoreApplication.translate("MainWindow", u"&Suite", None))
+        self.menuTheme.setTitle(QCoreApplication.translate("MainWindow", u"&Theme", None))
+        self.menuHelp.setTitle(QCoreApplication.translate("MainWindow", u"&Help", None))
+    # retranslateUi
+
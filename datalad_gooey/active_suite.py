@@ -1,16 +1,21 @@
+from functools import lru_cache
 from types import MappingProxyType
 from datalad import cfg
+from datalad.support.entrypoints import iter_entrypoints
 
 spec = None
 # names of parameters to exclude for any command
-# exclude_parameters = set()
+exclude_parameters = frozenset()
 
 # mapping of parameter names to display names
 # to be applied across all commands
-# parameter_display_names = {}
+parameter_display_names = MappingProxyType({})
 
 # mapping of group name/title to sort index
-# api_group_order = {}
+api_group_order = MappingProxyType({})
+
+# mapping of option names to values
+options = MappingProxyType({})
 
 #
 # API specifications
@@ -32,25 +37,42 @@ annexed_file_api = None
 other_api = None
 
 
+@lru_cache(maxsize=None)
+def get_suite_loaders(group: str = 'datalad.gooey.suites') -> MappingProxyType:
+    """Return a mapping of suite names to (unexecuted) entrypoint loaders
+
+    The result is cached, such that the distribution metadata are only
+    inspected once per process, regardless of how many times suites are
+    looked up.
+    """
+    return MappingProxyType({
+        sname: sload
+        for sname, _, sload in iter_entrypoints(group, load=False)
+    })
+
+
 active_suite = cfg.obtain('datalad.gooey.active-suite')
 epname = 'datalad.gooey.suites'
 
-from datalad.support.entrypoints import iter_entrypoints
-for sname, _, sload in iter_entrypoints(epname, load=False):
-    if sname != active_suite:
-        continue
-
+sload = get_suite_loaders(epname).get(active_suite)
+if sload is not None:
     # deposit the spec in read-only form
     spec = MappingProxyType(sload())
 
     # deploy convenience importable symbols
     for apiname, api in spec.get('apis', {}).items():
         globals()[f"{apiname}_api"] = api
+    # and resolve the generic settings once, rather than on each access
+    exclude_parameters = frozenset(spec.get('exclude_parameters', ()))
+    parameter_display_names = MappingProxyType(
+        spec.get('parameter_display_names', {}))
+    api_group_order = MappingProxyType(spec.get('api_group_order', {}))
+    options = MappingProxyType(spec.get('options', {}))
 
 if spec is None:
     raise RuntimeError(
         f'No Gooey suite {active_suite!r}! Have: '
-        f'{[n for n, _, _ in iter_entrypoints(epname, load=False)]}'
+        f'{list(get_suite_loaders(epname))}'
         ' Imploding...')
 
     api = dict()
@@ -1,3 +1,4 @@
+from collections import Counter
 from pathlib import Path
 import re
 from typing import Any
@@ -60,12 +61,28 @@ class AnnexMetadataEditor(MetadataEditor):
         # all field edits
         self.__fields = []
         self.__path = None
+        self.__dsroot = None
+        # long-running `git annex metadata --batch` process, started on
+        # first use, and reused for any subsequent load/save
+        self.__annex_batch = None
+        # item widgets of any field group (field names are grouped under
+        # the editor itself, field values under their field name widget),
+        # and the validators of these groups. Both are maintained by the
+        # item widgets
+        self._field_tracker = dict()
+        self._validators = dict()
+        # standard pixmaps of the editor's style, already scaled to the
+        # height of an item editor, shared by all item widgets
+        self._pixmap_cache = dict()
 
         editor_layout = QVBoxLayout()
         editor_layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(editor_layout)
         # first the form with the fields
         self.__field_form = QFormLayout()
+        # mapping of field name widgets to the layouts with their value
+        # widgets, to avoid searching the form for them
+        self.__field_layouts = dict()
         # enforce alignment across platforms, flow layout looks weird
         # with centered items
         self.__field_form.setFormAlignment(Qt.AlignLeft | Qt.AlignTop)
@@ -93,22 +110,23 @@ class AnnexMetadataEditor(MetadataEditor):
         editor_layout.addStretch()
 
     def set_path(self, path: Path):
+        from datalad.utils import get_dataset_root
+        # a batch process is tied to a particular dataset
+        self._close_annex_batch()
         self.__path = path
+        # determine once, needed for every load/save
+        self.__dsroot = Path(get_dataset_root(path))
         self._load_metadata()
 
     def _reset(self):
         # take care of cleaning up the underlying items
-        field_items = [
-            self.__field_form.itemAt(row, QFormLayout.LabelRole).widget()
-            # start after header
-            for row in range(1, self.__field_form.rowCount())
-        ]
+        field_items = list(self.__field_layouts)
         for fi in field_items:
             self._discard_item(fi)
         self.__bbx.button(QDialogButtonBox.Save).setDisabled(True)
 
     def _load_metadata(self):
-        res = _run_annex_metadata(self.__path)
+        res = self._run_annex_metadata()
         # just one record
         assert isinstance(res, dict)
         self._set_metadata_from_annexjson(res)
@@ -156,8 +174,8 @@ class AnnexMetadataEditor(MetadataEditor):
             item.set_state()
 
         data = {}
-        fn_validator = ItemWidget._validators[self]
-        for fni in ItemWidget._field_tracker[self]:
+        fn_validator = self._validators.get(self)
+        for fni in self._field_tracker.get(self, ()):
             # first check field name value, we don't accept invalid of empty
             if fn_validator.validate(fni.value, 0) != QValidator.Acceptable:
                 valid = _invalid(
@@ -165,9 +183,9 @@ class AnnexMetadataEditor(MetadataEditor):
             else:
                 _valid(fni)
             # now all values, may be empty to delete whole field
-            fv_validator = ItemWidget._validators[fni]
+            fv_validator = self._validators[fni]
             values = set()
-            for fvi in ItemWidget._field_tracker[fni]:
+            for fvi in self._field_tracker[fni]:
                 if fv_validator.validate(fvi.value, 0) != QValidator.Acceptable:
                     valid = _invalid(
                         fvi, 'Invalid value, set valid value or discard')
@@ -185,11 +203,34 @@ class AnnexMetadataEditor(MetadataEditor):
         if not valid:
             self.__bbx.button(QDialogButtonBox.Save).setDisabled(True)
             return
-        res = _run_annex_metadata(self.__path, data)
+        res = self._run_annex_metadata(data)
         # just one record
         assert isinstance(res, dict)
         self._set_metadata_from_annexjson(res)
 
+    def _run_annex_metadata(self, data=None):
+        if self.__annex_batch is None:
+            from datalad.cmd import BatchedCommand
+            self.__annex_batch = BatchedCommand(
+                _annex_metadata_cmd,
+                path=str(self.__dsroot),
+            )
+        return _run_annex_metadata(
+            self.__path, data,
+            dsroot=self.__dsroot,
+            batch=self.__annex_batch,
+        )
+
+    def _close_annex_batch(self):
+        if self.__annex_batch is not None:
+            self.__annex_batch.close()
+            self.__annex_batch = None
+
+    def closeEvent(self, *args, **kwargs):
+        # no need to keep git-annex around, when the editor is gone
+        self._close_annex_batch()
+        super().closeEvent(*args, **kwargs)
+
     def _add_field(self, from_record=False):
         # field name edit, make the editor itself the parent
         # the items will group themselves by parent to validate as a set
@@ -203,6 +244,7 @@ class AnnexMetadataEditor(MetadataEditor):
         flow_layout = FlowLayout()
         flow_layout.setContentsMargins(0, 0, 0, 0)
         self.__field_form.addRow(fn, flow_layout)
+        self.__field_layouts[fn] = flow_layout
         return fn, flow_layout
 
     def _on_addfield_clicked(self):
@@ -214,9 +256,8 @@ class AnnexMetadataEditor(MetadataEditor):
         self._add_field_value_add_pb(fn, layout)
 
     def _on_add_field_value_clicked(self, group_id, replace=None):
-        row = self._find_form_row_by_name_widget(group_id)
         # the flow layout for all value widgets
-        layout = self.__field_form.itemAt(row, QFormLayout.FieldRole)
+        layout = self.__field_layouts[group_id]
         if replace is not None:
             replace.close()
             layout.removeWidget(replace)
@@ -245,43 +286,25 @@ class AnnexMetadataEditor(MetadataEditor):
         layout.addWidget(frame)
         self.enable_save()
 
-    def _find_form_row_by_name_widget(self, widget):
-        # start searching after header row
-        for row in range(1, self.__field_form.rowCount()):
-            label_at_row = self.__field_form.itemAt(
-                row, QFormLayout.LabelRole).widget()
-            if widget == label_at_row:
-                return row
-        raise ValueError(
-            'Given widget does not correspond to field name widget')
-
     def _discard_item(self, item):
         self.enable_save()
         if isinstance(item.group_id, AnnexMetadataEditor):
             # the main editor is the group -> field name widget
-            row = self._find_form_row_by_name_widget(item)
-            layout = self.__field_form.itemAt(row, QFormLayout.FieldRole)
+            layout = self.__field_layouts.pop(item)
             i = layout.takeAt(0)
             while i:
                 i.widget().close()
                 i = layout.takeAt(0)
-            i = self.__field_form.itemAt(row, QFormLayout.LabelRole).widget()
-            i.close()
-            self.__field_form.removeRow(row)
+            item.close()
+            self.__field_form.removeRow(item)
         else:
             # -> field value widget
-            row = self._find_form_row_by_name_widget(item.group_id)
-            layout = self.__field_form.itemAt(row, QFormLayout.FieldRole)
+            layout = self.__field_layouts[item.group_id]
             item.close()
             layout.removeWidget(item)
 
 
 class ItemWidget(QFrame):
-    # track fields for a particular path across all class
-    # instances
-    _field_tracker = dict()
-    _validators = dict()
-
     def __init__(self,
                  group_id: Any,
                  editor: AnnexMetadataEditor,
@@ -291,16 +314,24 @@ class ItemWidget(QFrame):
         super().__init__(parent)
         self.__annex_metadata_editor = editor
         self.__group_id = group_id
-        if group_id not in ItemWidget._field_tracker:
+        # track fields for a particular path in the editor
+        field_tracker = editor._field_tracker
+        validators = editor._validators
+        if group_id not in field_tracker:
             items_widgets = set()
-            ItemWidget._field_tracker[group_id] = items_widgets
-            ItemWidget._validators[group_id] = \
-                AnnexMetadataFieldNameValidator(group_id, editor) \
+            field_tracker[group_id] = items_widgets
+            validators[group_id] = \
+                AnnexMetadataFieldNameValidator(editor) \
                 if is_field_name else \
-                AnnexMetadataValueValidator(group_id, editor)
+                AnnexMetadataValueValidator(editor)
         # register item in the group of its parent
-        items = self._field_tracker[group_id]
+        items = field_tracker[group_id]
         items.add(self)
+        validator = validators[group_id]
+        self.__validator = validator
+        # the value that is on record with the group validator
+        self.__value = ''
+        validator.update_value_count(None, self.__value)
 
         self.setFrameStyle(QFrame.StyledPanel)
         # all components in a horizontal arrangement
@@ -313,12 +344,14 @@ class ItemWidget(QFrame):
         edit.setClearButtonEnabled(True)
         edit.textChanged.connect(self._on_textchanged)
         edit.editingFinished.connect(self._on_editingfinished)
-        edit.setValidator(ItemWidget._validators[group_id])
+        edit.setValidator(validator)
         layout.addWidget(edit)
         self.__editor = edit
         # state label
         state = QLabel(self)
         self.__state_label = state
+        # the standard pixmap currently shown in the state label
+        self.__state_pixmap = None
         layout.addWidget(state)
         # discard button
         db = QToolButton(self)
@@ -335,11 +368,15 @@ class ItemWidget(QFrame):
 
     def closeEvent(self, *args, **kwargs):
         # unregister this item from its parent group
-        if self.__group_id in self._field_tracker:
-            self._field_tracker[self.__group_id].discard(self)
+        editor = self.__annex_metadata_editor
+        if self.__group_id in editor._field_tracker:
+            editor._field_tracker[self.__group_id].discard(self)
+        if self.__value is not None:
+            self.__validator.update_value_count(self.__value, None)
+            self.__value = None
         # if this item is itself a group_id, remove entire group
-        self._field_tracker.pop(self, None)
-        self._validators.pop(self, None)
+        editor._field_tracker.pop(self, None)
+        editor._validators.pop(self, None)
         # normal handling
         super().closeEvent(*args, **kwargs)
 
@@ -352,6 +389,11 @@ class ItemWidget(QFrame):
         return self.__editor.text()
 
     def _on_textchanged(self):
+        # keep the value count of the group up-to-date for validation
+        value = self.__editor.text()
+        if self.__value is not None:
+            self.__validator.update_value_count(self.__value, value)
+            self.__value = value
         # clear any checkmarks (empty pixmap)
         self.set_state()
         self.__annex_metadata_editor.enable_save()
@@ -372,14 +414,24 @@ class ItemWidget(QFrame):
 
     def set_state(self, stdpixmap=None, tooltip=None):
         if stdpixmap is None:
-            pixmap = QPixmap(0, 0)
+            # this is called on every text change, only clear once
+            if self.__state_pixmap is not None:
+                self.__state_label.setPixmap(QPixmap(0, 0))
         else:
-            pixmap = self.style().standardPixmap(stdpixmap)
-        # shrink the standard pixmap to the height of the editor
-        # if it happens to be humongous in some platform
-        if pixmap.size().height() > self.__editor.size().height():
-            pixmap = pixmap.scaledToHeight(self.__editor.size().height())
-        self.__state_label.setPixmap(pixmap)
+            height = self.__editor.size().height()
+            metadata_editor = self.__annex_metadata_editor
+            pixmap_cache = metadata_editor._pixmap_cache
+            pixmap = pixmap_cache.get((stdpixmap, height))
+            if pixmap is None:
+                # taken from the style of the editor that owns the cache
+                pixmap = metadata_editor.style().standardPixmap(stdpixmap)
+                # shrink the standard pixmap to the height of the editor
+                # if it happens to be humongous in some platform
+                if pixmap.size().height() > height:
+                    pixmap = pixmap.scaledToHeight(height)
+                pixmap_cache[(stdpixmap, height)] = pixmap
+            self.__state_label.setPixmap(pixmap)
+        self.__state_pixmap = stdpixmap
 
         if not tooltip:
             tooltip = ''
@@ -390,24 +442,39 @@ class ItemWidget(QFrame):
 
 
 class AnnexMetadataValueValidator(QValidator):
-    def __init__(self, group_id: Any, parent: QWidget):
+    def __init__(self, parent: QWidget):
         super().__init__(parent)
-        self.__group_id = group_id
+        # counts of the current values of all items in the validated group.
+        # maintained by the items via update_value_count(), such that
+        # checking for duplicates does not require a scan of the group
+        self.__value_counts = Counter()
+
+    def _count_key(self, value: str) -> str:
+        return value
+
+    def update_value_count(self, old: str or None, new: str or None):
+        """Register that an item of the group changed its value
+
+        ``None`` for ``old`` or ``new`` indicates that an item joined, or
+        left the group, respectively.
+        """
+        counts = self.__value_counts
+        if old is not None:
+            key = self._count_key(old)
+            counts[key] -= 1
+            if counts[key] < 1:
+                del counts[key]
+        if new is not None:
+            counts[self._count_key(new)] += 1
 
-    def validate(self, input: str, pos: int, compare_lower=False):
+    def validate(self, input: str, pos: int):
         # we cannot ever invalidate, because a user could always
         # enter another char to make it right
         if not input:
             return QValidator.Intermediate
 
         # check all items from this group
-        matching_items = sum(
-            (input.lower() == i.value.lower()
-             if compare_lower
-             else input == i.value)
-            for i in ItemWidget._field_tracker[self.__group_id]
-        )
-        if matching_items > 1:
+        if self.__value_counts[self._count_key(input)] > 1:
             return QValidator.Intermediate
         else:
             return QValidator.Acceptable
@@ -417,31 +484,47 @@ class AnnexMetadataFieldNameValidator(AnnexMetadataValueValidator):
     # from https://git-annex.branchable.com/metadata
     _valid_regex = re.compile('^[a-z0-9.\-_]+$')
 
+    def _count_key(self, value: str) -> str:
+        # field names are case-insensitive
+        return value.lower()
+
     def validate(self, input: str, pos: int):
         if not AnnexMetadataFieldNameValidator._valid_regex.match(
                 input.lower()):
             return QValidator.Invalid
         # otherwise like normal, but case-insensitive
-        return super().validate(input, pos, compare_lower=True)
+        return super().validate(input, pos)
 
 
-def _run_annex_metadata(path, data=None):
-    from datalad.runner import (
-        GitRunner,
-        StdOutCapture,
-    )
-    from datalad.utils import get_dataset_root
+_annex_metadata_cmd = ['git', 'annex', 'metadata', '--json', '--batch']
+
+
+def _run_annex_metadata(path, data=None, dsroot=None, batch=None):
+    """Query or set the git-annex metadata of a single file
+
+    If a running ``BatchedCommand`` for ``_annex_metadata_cmd`` is given
+    as ``batch``, the request is sent to it. Otherwise a dedicated
+    git-annex process is executed.
+    """
     import json
-    runner = GitRunner()
-    cmd = ['git', 'annex', 'metadata', '--json', '--batch']
-    dsroot = get_dataset_root(path)
+    if dsroot is None:
+        from datalad.utils import get_dataset_root
+        dsroot = get_dataset_root(path)
     j = {
         'file': str(path.relative_to(dsroot)),
     }
     if data:
         j['fields'] = data
+    if batch is not None:
+        return json.loads(batch(json.dumps(j)))
+
+    from datalad.runner import (
+        GitRunner,
+        StdOutCapture,
+    )
+    runner = GitRunner()
     out = runner.run(
-        cmd,
+        _annex_metadata_cmd,
         cwd=str(dsroot),
         stdin=f'{json.dumps(j)}\n'.encode('utf-8'),
         protocol=StdOutCapture,
@@ -1,6 +1,6 @@
 
 from collections.abc import Callable
-from itertools import zip_longest
+from functools import lru_cache
 from typing import List
 
 from datalad.interface.base import alter_interface_docs_for_api
@@ -31,19 +31,18 @@ def get_cmd_params(cmd: Callable) -> List:
     args, varargs, varkw, defaults = getargspec(cmd, include_kwonlyargs=True)
     if not args:
         return []
-    return list(
-        zip_longest(
-            # fuse parameters from the back, to match with their respective
-            # defaults -- if some have no defaults, they would be the first
-            args[::-1],
-            defaults[::-1],
-            # pad with a dedicate type, to be able to tell if there was a
-            # default or not
-            fillvalue=_NoValue)
-    # reverse the order again to match the original order in the signature
-    )[::-1]
-
-
+    defaults = defaults or ()
+    # defaults match the trailing parameters -- if some have no defaults,
+    # they would be the first. pad those with a dedicated type, to be able
+    # to tell if there was a default or not
+    n_nodefault = len(args) - len(defaults)
+    return [(a, _NoValue) for a in args[:n_nodefault]] \
+        + list(zip(args[n_nodefault:], defaults))
+
+
+# docstrings are static, and a command's docs are reformatted each time its
+# UI is generated. Cache the result to only pay the regex work once
+@lru_cache(maxsize=None)
 def format_param_docs(docs: str) -> str:
     """Removes Python API formatting of Parameter docs for GUI use"""
     if not docs:
@@ -51,6 +50,7 @@ def format_param_docs(docs: str) -> str:
     return alter_interface_docs_for_api(docs)
 
 
+@lru_cache(maxsize=None)
 def format_cmd_docs(docs: str) -> str:
     """Removes Python API formatting of Interface docs for GUI use"""
     if not docs:
@@ -1,6 +1,10 @@
+from functools import lru_cache
+from itertools import groupby
 import logging
 import os
 import platform
+import re
+import subprocess
 import sys
 from types import MappingProxyType
 from typing import cast
@@ -17,18 +21,19 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QFileDialog,
     QTextBrowser,
+    QMainWindow,
 )
 from PySide6.QtCore import (
     QObject,
     QSettings,
     Qt,
+    QTimer,
     Signal,
     Slot,
     QEvent,
 )
 from PySide6.QtGui import (
     QAction,
-    QCursor,
     QGuiApplication,
 )
 
@@ -36,14 +41,13 @@ import datalad
 from datalad import cfg as dlcfg
 import datalad.ui as dlui
 from datalad.interface.base import Interface
-from datalad.local.wtf import (
-    _render_report,
-    WTF,
-)
 from datalad.utils import chpwd
 
+# patch the patches...yeah!
+# only needed in the process that runs the app, not for any CLI helper
+import datalad_gooey.patches
+
 from .utils import (
-    load_ui,
     open_terminal_at_path,
     render_cmd_call,
 )
@@ -51,16 +55,36 @@ from .datalad_ui import GooeyUI
 from .dataladcmd_exec import GooeyDataladCmdExec
 from .dataladcmd_ui import GooeyDataladCmdUI
 from .cmd_actions import add_cmd_actions_to_menu
+from .constraints import EnsureConfigProcedureName
 from .fsbrowser import GooeyFilesystemBrowser
 from .resource_provider import gooey_resources
 from . import utility_actions as ua
-from . import credentials as cred
 from .history_widget import HistoryWidget
 from .metadata_widget import MetadataWidget
 from .property_widget import PropertyWidget
+from ._ui_main_window import Ui_MainWindow
 
 lgr = logging.getLogger('datalad.ext.gooey.app')
 
+# platform name, it does not change at runtime
+_PLATFORM = platform.system()
+# commands to open a path in the platform's file manager
+_FILE_MANAGER_CMDS = {
+    'Linux': ['xdg-open'],
+    'Darwin': ['open'],
+}
+
+
+class GooeyMainWindow(QMainWindow, Ui_MainWindow):
+    """Main window, as declared in resources/ui/main_window.ui
+
+    The UI declaration is compiled into `_ui_main_window` (`make ui`)
+    rather than loaded at runtime, to avoid parsing the XML on every start.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setupUi(self)
+
 
 class GooeyApp(QObject):
 
@@ -70,7 +94,7 @@ class GooeyApp(QObject):
     # Mapping of key widget names used in the main window to their widget
     # classes.  This mapping is used (and needs to be kept up-to-date) to look
     # up widget (e.g. to connect their signals/slots)
-    _widgets = {
+    _widgets = MappingProxyType({
         'contextTabs': QTabWidget,
         'consoleTabs': QTabWidget,
         'cmdTab': QWidget,
@@ -95,7 +119,7 @@ class GooeyApp(QObject):
         'actionAbout': QAction,
         'actionGetHelp': QAction,
         'actionDiagnostic_infos': QAction,
-    }
+    })
 
     def __init__(self, path: Path = None):
         super().__init__()
@@ -106,37 +130,55 @@ class GooeyApp(QObject):
         # we cannot handle ANSI coloring
         dlcfg.set('datalad.ui.color', 'off', scope='override', force=True)
 
-        # capture what env vars we modified, None means did not exist
-        self._restore_env = {
-            name: environ.get(name)
-            for name in (
-                'GIT_TERMINAL_PROMPT',
-                'SSH_ASKPASS_REQUIRE',
-                'SSH_ASKPASS',
-            )
+        env = {
+            # prevent any terminal-based interaction of Git
+            # do it here, not just for command execution to also catch any
+            # possible ad-hoc Git calls
+            'GIT_TERMINAL_PROMPT': '0',
+            # force asking passwords via Gooey
+            # we use SSH* because also Git falls back onto it
+            'SSH_ASKPASS_REQUIRE': 'force',
+            'SSH_ASKPASS': 'datalad-gooey-askpass',
         }
-        if platform.system() == 'Windows':
+        if _PLATFORM == 'Windows':
             # https://github.com/datalad/datalad-gooey/issues/371
             # alternative to https://github.com/datalad/datalad-gooey/pull/380
-            self._restore_env['DISPLAY'] = environ.get('DISPLAY')
-            environ['DISPLAY'] = "0:0"
-
-        # prevent any terminal-based interaction of Git
-        # do it here, not just for command execution to also catch any possible
-        # ad-hoc Git calls
-        environ['GIT_TERMINAL_PROMPT'] = '0'
-        # force asking passwords via Gooey
-        # we use SSH* because also Git falls back onto it
-        environ['SSH_ASKPASS_REQUIRE'] = 'force'
-        environ['SSH_ASKPASS'] = 'datalad-gooey-askpass'
+            env['DISPLAY'] = "0:0"
+        # capture what env vars we modified, None means did not exist
+        self._restore_env = {name: environ.get(name) for name in env}
+        environ.update(env)
 
         # setup themeing before the first dialog goes up
         self._setup_looknfeel()
 
         self._dlapi = None
-        self.__main_window = None
+        # the window is needed right away, no need to create it lazily
+        self.main_window = GooeyMainWindow()
+        # hook into all events that the main window receives
+        # e.g. to catch close events and store window configuration
+        self.main_window.installEventFilter(self)
+        # widgets already located in the main window, by name.
+        # locate all key widgets right away, they never change, and this
+        # also verifies that _widgets matches the UI declaration
+        self._widget_cache = {}
+        for name in self._widgets:
+            self.get_widget(name)
+        # log messages not yet appended to their log widget
+        self._log_buffer = []
+        # appending to the logs is deferred a little, to coalesce bursts
+        # of messages, e.g. results reported by a command
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        # msec
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
         self.__app_close_requested = False
         self._cmdexec = GooeyDataladCmdExec()
+        # number of commands that reported to have started, but not yet to
+        # have finished. It is maintained from the execution signals in
+        # the GUI thread, and is accurate by the time a slot runs, unlike
+        # the state of the executor's futures
+        self._n_running_cmds = 0
         self._cmdui = GooeyDataladCmdUI(self, self.get_widget('cmdTab'))
 
         # setup UI
@@ -146,7 +188,12 @@ class GooeyApp(QObject):
         )
         # set path for root item and PWD to give relative paths a reference
         # that makes sense within the app
-        self._set_root_path(path)
+        if path:
+            self._set_root_path(path)
+        else:
+            # the user needs to be asked for a path. do it once the main
+            # window is up, rather than with an empty screen
+            QTimer.singleShot(0, self._set_root_path)
 
         # remember what backend was in use
         self._prev_ui_backend = dlui.ui.backend
@@ -155,14 +202,23 @@ class GooeyApp(QObject):
         dlui.KNOWN_BACKENDS['gooey'] = GooeyUI
         dlui.ui.set_backend('gooey')
         uibridge = dlui.ui.ui.set_app(self)
+        # logs in background tabs are only updated once they are shown
+        self.get_widget('consoleTabs').currentChanged.connect(
+            self._flush_logs)
+
         self.get_widget('statusbar').addPermanentWidget(uibridge.progress_bar)
 
-        # connect the generic cmd execution signal to the handler
-        self.execute_dataladcmd.connect(self._cmdexec.execute)
+        # connect the generic cmd execution signal to the handler.
+        # these signals are only ever emitted from the GUI thread, hence
+        # the receivers can be called directly
+        self.execute_dataladcmd.connect(
+            self._cmdexec.execute, Qt.DirectConnection)
         # connect the generic cmd configuration signal to the handler
-        self.configure_dataladcmd.connect(self._cmdui.configure)
+        self.configure_dataladcmd.connect(
+            self._cmdui.configure, Qt.DirectConnection)
         # when a command was configured, pass it to the executor
-        self._cmdui.configured_dataladcmd.connect(self._cmdexec.execute)
+        self._cmdui.configured_dataladcmd.connect(
+            self._cmdexec.execute, Qt.DirectConnection)
 
         self.get_widget('statusbar').addPermanentWidget(
             self._cmdexec.activity_widget)
@@ -197,26 +253,30 @@ class GooeyApp(QObject):
         self.main_window.actionSetBaseDirectory.triggered.connect(
             self._set_root_path)
         self.main_window.actionCheck_for_new_version.triggered.connect(
-            lambda: ua.check_new_datalad_version(self))
+            self._check_new_datalad_version)
         self.main_window.actionReport_a_problem.triggered.connect(
-            lambda: ua.get_issue_template(self.main_window))
-        self.main_window.actionGetHelp.triggered.connect(
-            lambda: ua.get_help(self.main_window))
-        self.main_window.actionAbout.triggered.connect(
-            lambda: ua.show_about_info(self.main_window))
+            self._get_issue_template)
+        self.main_window.actionGetHelp.triggered.connect(self._get_help)
+        self.main_window.actionAbout.triggered.connect(self._show_about_info)
         self.main_window.actionDiagnostic_infos.triggered.connect(
-            lambda: ua.get_diagnostic_info(self))
+            self._get_diagnostic_info)
         self.main_window.actionSetAuthorIdentity.triggered.connect(
-            lambda: ua.set_git_identity(self.main_window))
+            self._set_git_identity)
         self.main_window.actionManageCredentials.triggered.connect(
-            lambda: cred.show_credential_manager(self.main_window))
-        # TODO could be done lazily to save in entrypoint iteration
-        self._setup_suites()
+            self._show_credential_manager)
+        # the suite menu is also populated lazily, this requires loading
+        # all suite specifications
+        self.get_widget('menuSuite').aboutToShow.connect(
+            self._populate_suite_menu)
         self._connect_menu_view(self.get_widget('menuView'))
 
+    @Slot(str, str, MappingProxyType, MappingProxyType)
     def _setup_ongoing_cmdexec(self, thread_id, cmdname, cmdargs, exec_params):
+        self._n_running_cmds += 1
         self.get_widget('statusbar').showMessage(f'Started `{cmdname}`')
-        self.main_window.setCursor(QCursor(Qt.BusyCursor))
+        # commands can run back to back, only switch for the first one
+        if self._n_running_cmds == 1:
+            self.main_window.setCursor(Qt.BusyCursor)
         # and give a persistent visual indication of what exactly is happening
         # in the log
         if cmdname.startswith('gooey_'):
@@ -227,18 +287,29 @@ class GooeyApp(QObject):
         self.get_widget('consoleTabs').setCurrentWidget(
             self.get_widget('commandLogTab'))
 
-        self.get_widget('commandLog').appendHtml(
-            f"<hr>{render_cmd_call(cmdname, cmdargs, 'Running')}"
+        self.append_log(
+            'commandLog',
+            f"<hr>{render_cmd_call(cmdname, cmdargs, 'Running')}",
+            html=True,
         )
 
     def _setup_stopped_cmdexec(
             self, thread_id, cmdname, cmdargs, exec_params, ce=None):
+        # a command can fail before it reported to have started, hence
+        # never go below zero
+        self._n_running_cmds = max(0, self._n_running_cmds - 1)
+        if not cmdname.startswith('gooey_'):
+            # any user command could have changed the configuration, or
+            # added procedures. internal helpers do neither
+            EnsureConfigProcedureName.invalidate()
         if ce is None:
             self.get_widget('statusbar').showMessage(f'Finished `{cmdname}`',
                                                      timeout=1000)
             if not cmdname.startswith('gooey_'):
-                self.get_widget('commandLog').appendHtml(
-                    f"{render_cmd_call(cmdname, cmdargs, '-> Done')}<hr>"
+                self.append_log(
+                    'commandLog',
+                    f"{render_cmd_call(cmdname, cmdargs, '-> Done')}<hr>",
+                    html=True,
                 )
         else:
             from datalad.support.exceptions import IncompleteResultsError
@@ -258,50 +329,93 @@ class GooeyApp(QObject):
                 # call)
                 # this alone would not be enough, because we do not know
                 # whether the command log is visible
-                self.get_widget('commandLog').appendHtml(
-                    f"<br>{failed_msg}{error_hint}"
+                self.append_log(
+                    'commandLog',
+                    f"<br>{failed_msg}{error_hint}",
+                    html=True,
                 )
             # but also barf the error into the logviewer
-            lv = self.get_widget('errorLog')
-            lv.appendHtml(failed_msg)
-            lv.appendHtml(
-                f'<font color="red"><pre>{ce.format_standard()}</pre></font>'
+            self.append_log(
+                'errorLog',
+                f'{failed_msg}'
+                f'<font color="red"><pre>{ce.format_standard()}</pre></font>',
+                html=True,
             )
-        if not self._cmdexec.n_running:
-            self.main_window.setCursor(QCursor(Qt.ArrowCursor))
+        if not self._n_running_cmds:
+            self.main_window.setCursor(Qt.ArrowCursor)
 
         # act on any pending close request
         if self.__app_close_requested:
             self.__app_close_requested = False
             self.main_window.close()
 
-    #@cached_property not available for PY3.7
-    @property
-    def main_window(self):
-        if self.__main_window is None:
-            self.__main_window = load_ui(
-                'main_window',
-                custom_widgets=[
-                    HistoryWidget,
-                    MetadataWidget,
-                    PropertyWidget,
-                ]
-            )
-            # hook into all events that the main window receives
-            # e.g. to catch close events and store window configuration
-            self.__main_window.installEventFilter(self)
-        return self.__main_window
+    def append_log(self, name: str, msg: str, html: bool = False) -> None:
+        """Append a message to a log widget
+
+        Messages are not appended immediately, but are collected and appended
+        together shortly after (at most 50ms later). This avoids a
+        relayout and repaint of a log for every single message, when many
+        are reported in quick succession. Messages for a log that is not
+        visible (e.g. on a tab in the background) are kept until the log is
+        brought to the front.
+
+        Parameters
+        ----------
+        name: str
+          Name of the log widget, e.g. 'commandLog'.
+        msg: str
+          Message to append.
+        html: bool, optional
+          Whether the message is HTML or plain text.
+        """
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+        self._log_buffer.append((name, html, msg))
+
+    @Slot()
+    def _flush_logs(self) -> None:
+        self._log_flush_timer.stop()
+        buffer = []
+        pending = []
+        for entry in self._log_buffer:
+            # the order is kept for each individual log
+            if self.get_widget(entry[0]).isVisibleTo(self.main_window):
+                buffer.append(entry)
+            else:
+                pending.append(entry)
+        self._log_buffer = pending
+        logs = set(self.get_widget(name) for name, _, _ in buffer)
+        for log in logs:
+            log.setUpdatesEnabled(False)
+        # keep the original order, but join subsequent plain-text messages
+        for (name, html), msgs in groupby(buffer, key=lambda x: x[:2]):
+            log = self.get_widget(name)
+            if html:
+                for _, _, msg in msgs:
+                    log.appendHtml(msg)
+            else:
+                log.appendPlainText('\n'.join(msg for _, _, msg in msgs))
+        for log in logs:
+            log.setUpdatesEnabled(True)
 
     def get_widget(self, name: str) -> QWidget:
+        # the widgets of the main window are never replaced, hence each
+        # needs to be located only once
+        wgt = self._widget_cache.get(name)
+        if wgt is not None:
+            return wgt
         wgt_cls = self._widgets.get(name)
         if not wgt_cls:
             raise ValueError(f"Unknown widget {name}")
-        wgt = cast(QWidget, self.main_window.findChild(wgt_cls, name=name))
-        if not wgt:
+        # the compiled UI exposes all named widgets as attributes of the
+        # main window, no need to search the object tree
+        wgt = cast(QWidget, getattr(self.main_window, name, None))
+        if not isinstance(wgt, wgt_cls):
             # if this happens, our internal _widgets is out of sync
             # with the UI declaration
             raise RuntimeError(
                 f"Could not locate widget {name} ({wgt_cls.__name__})")
+        self._widget_cache[name] = wgt
         return wgt
 
     def _set_root_path(self, path: Path = None):
@@ -336,6 +450,9 @@ class GooeyApp(QObject):
             # internal machinery expects absolute paths.
             # relative is relative to CWD
             path = Path.cwd() / path
+        if path == getattr(self, '_path', None):
+            # same root as before, nothing to change
+            return
         chpwd(path)
         self._path = path
         # (re)init the browser
@@ -375,13 +492,20 @@ class GooeyApp(QObject):
         if not act:
             return
         path = act.data()
-        platform_name = platform.system()
-        if platform_name == 'Linux':
-            os.system(f'xdg-open "{path}"')
-        elif platform_name == 'Darwin':
-            os.system(f'open "{path}"')
-        elif platform_name == 'Windows':
+        if _PLATFORM == 'Windows':
             os.startfile(str(path))
+            return
+        cmd = _FILE_MANAGER_CMDS.get(_PLATFORM)
+        if cmd is None:
+            lgr.error('Unknown platform: %s', _PLATFORM)
+            return
+        # no shell, and do not wait for the file manager
+        try:
+            subprocess.Popen([*cmd, str(path)])
+        except OSError as e:
+            # e.g. no launcher installed on a minimal system
+            from datalad.support.exceptions import CapturedException
+            lgr.error('Could not start file manager: %s', CapturedException(e))
 
     def _open_terminal(self):
         """Private slot to open a terminal at the given location"""
@@ -390,6 +514,7 @@ class GooeyApp(QObject):
             return
         open_terminal_at_path(act.data())
 
+    @Slot()
     def _populate_datalad_menu(self):
         """Private slot to populate connected QMenus with dataset actions"""
         sender = self.sender()
@@ -406,8 +531,39 @@ class GooeyApp(QObject):
         self.get_widget('menuDatalad').aboutToShow.disconnect(
             self._populate_datalad_menu)
 
+    @Slot()
+    def _check_new_datalad_version(self):
+        ua.check_new_datalad_version(self)
+
+    @Slot()
+    def _get_issue_template(self):
+        ua.get_issue_template(self.main_window)
+
+    @Slot()
+    def _get_help(self):
+        ua.get_help(self.main_window)
+
+    @Slot()
+    def _show_about_info(self):
+        ua.show_about_info(self.main_window)
+
+    @Slot()
+    def _get_diagnostic_info(self):
+        ua.get_diagnostic_info(self)
+
+    @Slot()
+    def _set_git_identity(self):
+        ua.set_git_identity(self.main_window)
+
+    @Slot()
+    def _show_credential_manager(self):
+        # the credential manager is rarely used, import only when needed
+        from .credentials import show_credential_manager
+        show_credential_manager(self.main_window)
+
     @Slot(Interface, list)
     def _app_cmdexec_results_handler(self, cls, res):
+        from datalad.local.wtf import WTF
         if cls != WTF:
             return
         for r in res:
@@ -422,6 +578,7 @@ class GooeyApp(QObject):
             msg = "Internal error creating diagnostic information"
         else:
             msg = "Diagnostic information was copied to clipboard"
+            from datalad.local.wtf import _render_report
             infos = _render_report(res)
             clipboard = QGuiApplication.clipboard()
             clipboard.setText(
@@ -431,24 +588,29 @@ class GooeyApp(QObject):
         mbox(self.main_window, 'Diagnostic infos', msg)
 
     def _connect_menu_view(self, menu: QMenu):
-        for cfgvar, menuname, subject in (
-                ('datalad.gooey.active-suite', 'menuSuite', 'suite'),
-                ('datalad.gooey.ui-theme', 'menuTheme', 'theme'),
-        ):
-            mode = dlcfg.obtain(cfgvar)
-            submenu = menu.findChild(QMenu, menuname)
-            for a in submenu.actions():
-                a.triggered.connect(self._set_mode_cfg)
-                a.setData((cfgvar, subject))
-                if a.objectName().split('_')[-1] == mode:
-                    a.setDisabled(True)
-
-    def _set_mode_cfg(self):
+        # the theme in effect was already determined at startup,
+        # no need to query the configuration again.
+        # the suite menu is connected when it is populated
+        self._connect_mode_actions(
+            menu.findChild(QMenu, 'menuTheme'),
+            'datalad.gooey.ui-theme', 'theme', self._uitheme)
+
+    def _connect_mode_actions(
+            self, menu: QMenu, cfgvar: str, subject: str, mode: str):
         # this works for specially crafted actions with names that
         # have trailing `_<mode-label>` component in their name
+        for a in menu.actions():
+            amode = a.objectName().rpartition('_')[2]
+            a.triggered.connect(self._set_mode_cfg)
+            a.setData((cfgvar, subject, amode))
+            if amode == mode:
+                a.setDisabled(True)
+
+    def _set_mode_cfg(self):
+        # the actions were equipped with all necessary info
+        # by _connect_mode_actions()
         action = self.sender()
-        cfgvar, subject = action.data()
-        mode = action.objectName().split('_')[-1]
+        cfgvar, subject, mode = action.data()
         assert mode
         dlcfg.set(cfgvar, mode, scope='global')
         QMessageBox.information(
@@ -462,25 +624,43 @@ class GooeyApp(QObject):
         qtapp.setWindowIcon(gooey_resources.get_icon('app_icon_32'))
 
         uitheme = dlcfg.obtain('datalad.gooey.ui-theme')
+        # keep the theme in effect, no need to query it again later
+        self._uitheme = uitheme
         if uitheme not in ('system', 'light', 'dark'):
             lgr.warning('Unsupported UI theme label %r', uitheme)
             return
         if uitheme != 'system':
             # go custom, if supported
-            try:
-                import qdarktheme
-            except ImportError:
+            stylesheet = _get_theme_stylesheet(uitheme)
+            if stylesheet is None:
                 lgr.warning('Custom UI theme not supported. '
                             'Missing `pyqtdarktheme` installation.')
                 return
-            qtapp.setStyleSheet(qdarktheme.load_stylesheet(uitheme))
-
-    def _setup_suites(self):
-        # put known suites in menu
+            # nothing to do, if an app instance in this process already
+            # applied it
+            if qtapp.styleSheet() != stylesheet:
+                qtapp.setStyleSheet(stylesheet)
+
+    @Slot()
+    def _populate_suite_menu(self):
+        """Private slot to put all known suites in the suite menu"""
         suite_menu = self.get_widget('menuSuite')
-        from datalad.support.entrypoints import iter_entrypoints
-        for sname, _, suite in iter_entrypoints(
-                'datalad.gooey.suites', load=True):
+        # remove the placeholder that makes the menu show on a mac
+        suite_menu.clear()
+        from .active_suite import (
+            active_suite,
+            get_suite_loaders,
+        )
+        actions = []
+        for sname, sload in get_suite_loaders().items():
+            try:
+                suite = sload()
+            except Exception as e:
+                # a broken suite must not prevent listing the others
+                from datalad.support.exceptions import CapturedException
+                ce = CapturedException(e)
+                lgr.warning('Failed to load Gooey suite %s: %s', sname, ce)
+                continue
             title = suite.get('title')
             if not title:
                 title = sname.capitalize()
@@ -489,20 +669,29 @@ class GooeyApp(QObject):
             action.setObjectName(f"actionSetGooeySuite_{sname}")
             if description:
                 action.setToolTip(description)
-            suite_menu.addAction(action)
+            actions.append(action)
+        suite_menu.addActions(actions)
+        self._connect_mode_actions(
+            suite_menu, 'datalad.gooey.active-suite', 'suite', active_suite)
+        # immediately sever the connection to avoid repopulating the menu
+        # over and over
+        suite_menu.aboutToShow.disconnect(self._populate_suite_menu)
 
     def _restore_configuration(self) -> None:
         mw = self.main_window
         # Restore prior configuration
         self._qt_settings = QSettings("datalad", self.__class__.__name__)
-        mw.restoreGeometry(self._qt_settings.value('geometry'))
-        mw.restoreState(self._qt_settings.value('state'))
-
         fs_browser: QWidget = self.get_widget('fsBrowser')
-        fs_browser.restoreGeometry(
-            self._qt_settings.value('geometry/fsBrowser'))
-        fs_browser.header().restoreState(
-            self._qt_settings.value('state/fsBrowser/header'))
+        for key, restore in (
+                ('geometry', mw.restoreGeometry),
+                ('state', mw.restoreState),
+                ('geometry/fsBrowser', fs_browser.restoreGeometry),
+                ('state/fsBrowser/header', fs_browser.header().restoreState),
+        ):
+            value = self._qt_settings.value(key)
+            # nothing is stored on first start
+            if value is not None:
+                restore(value)
 
     def _store_configuration(self) -> None:
         mw = self.main_window
@@ -518,7 +707,7 @@ class GooeyApp(QObject):
 
     def eventFilter(self, watched, event):
         if event.type() == QEvent.Close and watched is self.main_window:
-            if self._cmdexec.n_running:
+            if self._n_running_cmds:
                 # we ignore close events while exec threads are still running
                 # instead we set a flag to trigger another close
                 # event when a command exits
@@ -535,7 +724,9 @@ class GooeyApp(QObject):
             dlui.ui.set_backend(self._prev_ui_backend)
             # restore any possible term prompt setup
             for var, val in self._restore_env.items():
-                if val is not None:
+                if val is None:
+                    environ.pop(var, None)
+                else:
                     environ[var] = val
             return super().eventFilter(watched, event)
         elif event.type() in (QEvent.Destroy, QEvent.ChildRemoved):
@@ -546,6 +737,72 @@ class GooeyApp(QObject):
             return super().eventFilter(watched, event)
 
 
+# file paths referenced in a stylesheet, e.g. url(/some/icon.svg)
+_re_stylesheet_url = re.compile(r'url\(\s*["\']?([^)"\']+?)["\']?\s*\)')
+
+
+@lru_cache(maxsize=None)
+def _get_theme_stylesheet(uitheme: str) -> str or None:
+    """Return the stylesheet for a `pyqtdarktheme` UI theme
+
+    Importing `qdarktheme` and rendering a stylesheet takes a substantial
+    share of the startup time. The stylesheet only depends on the installed
+    versions of `pyqtdarktheme` and Qt, hence it is cached on disk (and in
+    memory, for the lifetime of the process). A cached stylesheet is only
+    used, if all files it references still exist.
+
+    Returns
+    -------
+    str or None
+      None is returned, if `pyqtdarktheme` is not installed.
+    """
+    if sys.version_info < (3, 10):
+        # 3.10 is when it was no longer provisional
+        from importlib_metadata import (
+            PackageNotFoundError,
+            version,
+        )
+    else:
+        from importlib.metadata import (
+            PackageNotFoundError,
+            version,
+        )
+    from PySide6 import __version__ as pyside_version
+    try:
+        qdt_version = version('pyqtdarktheme')
+    except PackageNotFoundError:
+        return None
+    cache_path = Path(dlcfg.obtain('datalad.locations.cache')) / 'gooey' \
+        / f'qdarktheme-{qdt_version}-{pyside_version}-{uitheme}.qss'
+    try:
+        stylesheet = cache_path.read_text(encoding='utf-8')
+        # the stylesheet references icon files by absolute path. They are
+        # only written as a side effect of `qdarktheme.load_stylesheet()`,
+        # and could have been removed since the stylesheet was cached
+        missing = [
+            p for p in _re_stylesheet_url.findall(stylesheet)
+            if not Path(p).exists()
+        ]
+        if not missing:
+            return stylesheet
+        lgr.debug('Stylesheet cache references missing files, e.g. %s',
+                  missing[0])
+    except Exception as e:
+        lgr.debug('No usable stylesheet cache: %s', e)
+
+    try:
+        import qdarktheme
+    except ImportError:
+        return None
+    stylesheet = qdarktheme.load_stylesheet(uitheme)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(stylesheet, encoding='utf-8')
+    except Exception as e:
+        lgr.debug('Could not store stylesheet cache: %s', e)
+    return stylesheet
+
+
 def main():
     qtapp = QApplication(sys.argv)
     gooey = GooeyApp()
@@ -25,7 +25,10 @@ class GooeyAskPass(Interface):
             QLineEdit
         )
 
-        QApplication(sys.argv)
+        # reuse an existing application instance, a second one cannot
+        # be created
+        if QApplication.instance() is None:
+            QApplication(sys.argv)
         cred, ok = QInputDialog.getText(
             None,
             'DataLad Gooey',
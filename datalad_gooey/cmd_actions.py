@@ -1,7 +1,42 @@
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QMenu
 
-from .active_suite import spec as active_suite
+from .active_suite import api_group_order
+
+
+# command grouping of API specifications, by id() of the API mapping
+_grouped_api_cache = {}
+
+
+def _get_grouped_api(api):
+    """Return the commands of an API grouped by their target menu (cached)
+
+    API specifications are never modified after loading, hence the grouping
+    is computed only once per API, no matter how often a menu is populated.
+
+    Returns
+    -------
+    list
+      Items are tuples of group name and a list of (cmdname, cmdspec) tuples.
+      The first item has a group name of `None` and lists all commands
+      without a group. All other items are sorted by the group order of the
+      active suite.
+    """
+    # the API is stored alongside to make sure that the id() cannot be
+    # reused by another object
+    cached = _grouped_api_cache.get(id(api))
+    if cached is not None and cached[0] is api:
+        return cached[1]
+    groups = {}
+    for cmdname, cmdspec in api.items():
+        groups.setdefault(cmdspec.get('group'), []).append((cmdname, cmdspec))
+    grouped = [(None, groups.pop(None, []))]
+    grouped.extend(sorted(
+        groups.items(),
+        # sort items with no sorting indicator last
+        key=lambda x: api_group_order.get(x[0], ('zzzz'))))
+    _grouped_api_cache[id(api)] = (api, grouped)
+    return grouped
 
 
 def add_cmd_actions_to_menu(parent, receiver, api, menu=None, cmdkwargs=None):
@@ -20,48 +55,32 @@ def add_cmd_actions_to_menu(parent, receiver, api, menu=None, cmdkwargs=None):
 
     group_separator = menu.addSeparator()
 
-    # generate a submenu for each unique group specification
-    # across all commands in the dataset API
-    submenus = {
-        group: QMenu(group, parent=menu)
-        for group in set(
-            cmdspec['group'] for cmdspec in api.values()
-            if 'group' in cmdspec
-        )
-    }
-
-    for cmdname, cmdspec in api.items():
-        # we create a dedicated action for each command
-        action = QAction(cmdspec.get('name', cmdname), parent=parent)
-        # the name of the command is injected into the action
-        # as user data. We wrap it in a dict to enable future
-        # additional payload
-        adata = dict(__cmd_name__=cmdname, __api__=api)
-        # put on record, if we are generating actions for a specific
-        # dataset
-        if cmdkwargs is not None:
-            adata.update(cmdkwargs)
-        action.setData(adata)
-        # all actions connect to the command configuration
-        # UI handler, such that clicking on the menu item
-        # brings up the config UI
-        action.triggered.connect(receiver)
-        # add to menu
-        # sort and group actions by some semantics
-        # e.g. all commands from one extension together
-        # to avoid a monster menu.
-        # if the menu lookup knows a better place to put a command
-        # based on the command interface class, it will be used
-        # instead of the main menu
-        target_menu = submenus.get(cmdspec.get('group'), menu)
-        target_menu.addAction(action)
-
-    for group, submenu in sorted(
-            submenus.items(),
-            # sort items with no sorting indicator last
-            key=lambda x: active_suite.get('api_group_order', {}).get(
-                x[0], ('zzzz'))):
-        # skip menus without actions
-        if not submenu.actions():
-            continue
-        menu.insertMenu(group_separator, submenu)
+    # sort and group actions by some semantics
+    # e.g. all commands from one extension together
+    # to avoid a monster menu.
+    # commands with a group go into a dedicated submenu, all others
+    # into the main menu
+    for group, cmds in _get_grouped_api(api):
+        target_menu = menu if group is None else QMenu(group, parent=menu)
+        actions = []
+        for cmdname, cmdspec in cmds:
+            # we create a dedicated action for each command
+            action = QAction(cmdspec.get('name', cmdname), parent=parent)
+            # the name of the command is injected into the action
+            # as user data. We wrap it in a dict to enable future
+            # additional payload
+            adata = dict(__cmd_name__=cmdname, __api__=api)
+            # put on record, if we are generating actions for a specific
+            # dataset
+            if cmdkwargs is not None:
+                adata.update(cmdkwargs)
+            action.setData(adata)
+            # all actions connect to the command configuration
+            # UI handler, such that clicking on the menu item
+            # brings up the config UI
+            action.triggered.connect(receiver)
+            actions.append(action)
+        # add all actions of a menu in one go
+        target_menu.addActions(actions)
+        if group is not None:
+            menu.insertMenu(group_separator, target_menu)
@@ -1,87 +1,182 @@
-# expensive import, we import from the full API
-# to ensure getting all dataset methods from any extension
-import datalad.api as dlapi
-
-from datalad.interface.base import (
-    Interface,
-    get_interface_groups,
-    load_interface,
-)
-from datalad.utils import get_wrapped_class
+import hashlib
+import json
+import logging
+from pathlib import Path
+import sys
 
-from .api_utils import (
-    get_cmd_displayname,
-    get_cmd_params,
+from datalad import (
+    __version__ as dlversion,
+    cfg as dlcfg,
 )
+from datalad.interface.base import get_interface_groups
+
 from .simplified_api import api as simple_api
 
-# mapping of command interface classes to interface group titles
-_cmd_group_lookup = {
-    load_interface(cmd_spec): title
-    for id_, title, cmds in sorted(get_interface_groups(), key=lambda x: x[0])
-    for cmd_spec in cmds
-}
+lgr = logging.getLogger('datalad.ext.gooey.complete_api')
 
-# make each extension package its own group
-from datalad.support.entrypoints import iter_entrypoints
-for ename, _, (grp_descr, interfaces) in iter_entrypoints(
-        'datalad.extensions', load=True):
-    for intfspec in interfaces:
-        # turn the interface spec into an instance
-        intf = load_interface(intfspec[:2])
-        _cmd_group_lookup[intf] = grp_descr
+# bump whenever the structure of the cached API specification changes
+_API_CACHE_FORMAT = 2
 
 
-# all supported commands
-api = {}
-for mname in dir(dlapi):
-    # iterate over all members of the Dataset class and find the
-    # methods that are command interface callables
-    # skip any private stuff
-    if mname.startswith('_'):
-        continue
-    # right now, we are technically not able to handle GUI inception
-    # and need to prevent launching multiple instances of this app.
-    # we also do not want the internal gooey helpers
-    if mname.startswith('gooey'):
-        continue
-    m = getattr(dlapi, mname)
+def _get_api_cache_path() -> Path:
+    """Return the location of the API cache for the present installation
+
+    The file name encodes the versions of DataLad and all installed extension
+    packages, such that any change to the set of available commands yields a
+    different cache file.
+    """
+    if sys.version_info < (3, 10):
+        # 3.10 is when it was no longer provisional
+        from importlib_metadata import distributions
+    else:
+        from importlib.metadata import distributions
+    extensions = sorted(
+        (d.metadata['Name'], d.version)
+        for d in distributions()
+        if any(ep.group == 'datalad.extensions' for ep in d.entry_points)
+    )
+    key = hashlib.sha1(
+        repr((_API_CACHE_FORMAT, dlversion, extensions)).encode('utf-8')
+    ).hexdigest()
+    return Path(dlcfg.obtain('datalad.locations.cache')) / 'gooey' \
+        / f'complete_api-{key}.json'
+
+
+def _build_api_specs():
+    """Determine the specification of all available commands
+
+    This requires importing the full DataLad API, including all extensions,
+    and inspecting the signatures of all commands. It is expensive.
+
+    Returns
+    -------
+    (dict, list)
+      Mapping of command names to their specification, and names of all
+      commands that are also available as `Dataset` methods.
+    """
+    # expensive import, we import from the full API
+    # to ensure getting all dataset methods from any extension
+    import datalad.api as dlapi
+
+    from datalad.interface.base import Interface
+    from datalad.utils import get_wrapped_class
+
+    from .api_utils import (
+        get_cmd_displayname,
+        get_cmd_params,
+    )
+
+    # mapping of command interface (module name, class name) to interface
+    # group titles. Interfaces are not loaded for this, only commands that
+    # are actually found in the API are matched against it
+    _cmd_group_lookup = {
+        tuple(cmd_spec[:2]): title
+        for id_, title, cmds in sorted(
+            get_interface_groups(), key=lambda x: x[0])
+        for cmd_spec in cmds
+    }
+
+    # make each extension package its own group
+    from datalad.support.entrypoints import iter_entrypoints
+    for ename, _, (grp_descr, interfaces) in iter_entrypoints(
+            'datalad.extensions', load=True):
+        for intfspec in interfaces:
+            _cmd_group_lookup[tuple(intfspec[:2])] = grp_descr
+
+    # all supported commands
+    api = {}
+    for mname in dir(dlapi):
+        # iterate over all members of the Dataset class and find the
+        # methods that are command interface callables
+        # skip any private stuff.
+        # right now, we are also technically not able to handle GUI
+        # inception and need to prevent launching multiple instances of
+        # this app. we also do not want the internal gooey helpers
+        if mname.startswith(('_', 'gooey')):
+            continue
+        m = getattr(dlapi, mname)
+        try:
+            # if either of the following tests fails, this member is not
+            # a datalad command
+            cls = get_wrapped_class(m)
+            assert issubclass(cls, Interface)
+        except Exception:
+            continue
+        cmd_spec = dict(name=get_cmd_displayname({}, mname))
+        # extensions can patch a command by replacing its interface with a
+        # subclass declared elsewhere (e.g. datalad-next), hence also
+        # consider the base classes for a match with a declared interface
+        cmd_group = next(
+            (_cmd_group_lookup[(c.__module__, c.__name__)]
+             for c in cls.__mro__
+             if (c.__module__, c.__name__) in _cmd_group_lookup),
+            None,
+        )
+        if cmd_group:
+            cmd_spec['group'] = cmd_group
+        # order of parameters is defined by order in the signature of the
+        # command
+        parameter_order = {p[0]: i for i, p in enumerate(get_cmd_params(m))}
+        # but always put any existing `dataset` parameter first, because
+        # (minus a few exceptions) it will define the scope of a command, and
+        # also influence other parameter choices (list of available remotes,
+        # basedir, etc.). therefore it is useful to have users process this
+        # first
+        if 'dataset' in parameter_order:
+            parameter_order['dataset'] = -1
+        cmd_spec['parameter_order'] = parameter_order
+
+        api[mname] = cmd_spec
+
+    # commands that operate on datasets, are attached as methods to the
+    # Dataset class
+    dataset_cmds = [name for name in dir(dlapi.Dataset) if name in api]
+    return api, dataset_cmds
+
+
+def _load_api_specs():
+    """Like `_build_api_specs()`, but reuses the outcome of a previous run
+
+    The API specification only depends on the installed software. It is
+    stored on disk after it was built, and loaded from there on subsequent
+    application starts.
+    """
+    cache_path = _get_api_cache_path()
     try:
-        # if either of the following tests fails, this member is not
-        # a datalad command
-        cls = get_wrapped_class(m)
-        assert issubclass(cls, Interface)
-    except Exception:
-        continue
-    cmd_spec = dict(name=get_cmd_displayname({}, mname))
-    cmd_group = _cmd_group_lookup.get(cls)
-    if cmd_group:
-        cmd_spec['group'] = cmd_group
-    # order of parameters is defined by order in the signature of the command
-    parameter_order = {p[0]: i for i, p in enumerate(get_cmd_params(m))}
-    # but always put any existing `dataset` parameter first, because (minus a
-    # few exceptions) it will define the scope of a command, and also influence
-    # other parameter choices (list of available remotes, basedir, etc.).
-    # therefore it is useful to have users process this first
-    if 'dataset' in parameter_order:
-        parameter_order['dataset'] = -1
-    cmd_spec['parameter_order'] = parameter_order
-
-    # inherit the hand-crafted constraints of the simple api, if possible
+        cache = json.loads(cache_path.read_text(encoding='utf-8'))
+        return cache['api'], cache['dataset_api']
+    except Exception as e:
+        lgr.debug('No usable API cache, building API specification: %s', e)
+
+    api, dataset_cmds = _build_api_specs()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps(dict(api=api, dataset_api=dataset_cmds)),
+            encoding='utf-8',
+        )
+    except Exception as e:
+        lgr.debug('Could not store API cache: %s', e)
+    return api, dataset_cmds
+
+
+# all supported commands
+api, _dataset_cmds = _load_api_specs()
+for mname, cmd_spec in api.items():
+    # inherit the hand-crafted constraints of the simple api, if possible.
+    # these are not part of any cache, they can depend on the runtime
+    # environment
     simple_cmd_constraints = simple_api.get(
         mname, {}).get('parameter_constraints')
     if simple_cmd_constraints:
         cmd_spec['parameter_constraints'] = simple_cmd_constraints
 
-    api[mname] = cmd_spec
-
 
 # commands that operate on datasets, are attached as methods to the
 # Dataset class
 dataset_api = {
     name: api[name]
-    for name in dir(dlapi.Dataset)
-    if name in api
+    for name in _dataset_cmds
 }
 
 gooey_suite = dict(
@@ -1,3 +1,5 @@
+from functools import lru_cache
+import os
 from pathlib import (
     Path,
     PurePath,
@@ -122,14 +124,17 @@ class EnsureMapping(Constraint):
     def __call__(self, value) -> Dict:
         # determine key and value from various kinds of input
         if isinstance(value, str):
-            # will raise if it cannot split into two
-            key, val = value.split(sep=self._delimiter, maxsplit=1)
+            key, delim, val = value.partition(self._delimiter)
+            if not delim:
+                raise ValueError(
+                    f'{value!r} does not contain the key/value delimiter '
+                    f'{self._delimiter!r}')
         elif isinstance(value, dict):
             if not len(value):
                 raise ValueError('dict does not contain a key')
             elif len(value) > 1:
                 raise ValueError(f'{value} contains more than one key')
-            key, val = value.copy().popitem()
+            key, val = next(iter(value.items()))
         elif isinstance(value, (list, tuple)):
             if not len(value) == 2:
                 raise ValueError('key/value sequence does not have length 2')
@@ -347,6 +352,47 @@ class EnsurePath(Constraint):
         )
 
 
+@lru_cache(maxsize=1024)
+def _check_ref_format(value: str,
+                      allow_onelevel: bool,
+                      normalize: bool,
+                      refspec_pattern: bool) -> str or None:
+    """Validate a reference name with `git check-ref-format` (cached)
+
+    Constraints are evaluated repeatedly for the same input, e.g. while
+    a form is edited. Git's verdict only depends on the arguments, hence
+    it is determined only once.
+
+    Returns
+    -------
+    str or None
+      The (normalized, if requested) reference name, or `None` if the
+      value is not a valid reference name.
+    """
+    from datalad.runner import GitRunner, CommandError, StdOutCapture
+    runner = GitRunner()
+    cmd = ['git', 'check-ref-format']
+    cmd.append('--allow-onelevel'
+               if allow_onelevel
+               else '--no-allow-onelevel')
+    if refspec_pattern:
+        cmd.append('--refspec-pattern')
+    if normalize:
+        cmd.append('--normalize')
+
+    cmd.append(value)
+
+    try:
+        out = runner.run(cmd, protocol=StdOutCapture)
+    except CommandError:
+        return None
+
+    if normalize:
+        return out['stdout'].strip()
+    else:
+        return value
+
+
 class EnsureGitRefName(Constraint):
     """Ensures that a reference name is well formed
 
@@ -381,28 +427,15 @@ class EnsureGitRefName(Constraint):
             # simple, do here
             raise ValueError('refname must not be empty')
 
-        from datalad.runner import GitRunner, CommandError, StdOutCapture
-        runner = GitRunner()
-        cmd = ['git', 'check-ref-format']
-        cmd.append('--allow-onelevel'
-                   if self._allow_onelevel
-                   else '--no-allow-onelevel')
-        if self._refspec_pattern:
-            cmd.append('--refspec-pattern')
-        if self._normalize:
-            cmd.append('--normalize')
-
-        cmd.append(value)
-
-        try:
-            out = runner.run(cmd, protocol=StdOutCapture)
-        except CommandError as e:
-            raise ValueError(f'{value} is not a valid refname') from e
-
-        if self._normalize:
-            return out['stdout'].strip()
-        else:
-            return value
+        refname = _check_ref_format(
+            value,
+            self._allow_onelevel,
+            self._normalize,
+            self._refspec_pattern,
+        )
+        if refname is None:
+            raise ValueError(f'{value} is not a valid refname')
+        return refname
 
     def long_description(self):
         return 'must be a string{}'.format(
@@ -439,12 +472,17 @@ class EnsureDatasetSiblingName(EnsureStr):
         # basic protection against an empty label
         super().__init__(min_len=1)
         self._allow_none = allow_none
+        self._none_constraint = EnsureStrOrNoneWithEmptyIsNone() \
+            if allow_none else None
+        # dataset-specific constraints, by dataset path. Each entry is a
+        # tuple of the Git config file state, and the constraint
+        self._dataset_constraints = {}
 
     def __call__(self, value):
         if self._allow_none:
-            return EnsureStrOrNoneWithEmptyIsNone()(value)
+            return self._none_constraint(value)
         else:
-            return super()(value)
+            return super().__call__(value)
 
     def long_description(self):
         return 'value must be the name of a dataset sibling' \
@@ -458,7 +496,19 @@ class EnsureDatasetSiblingName(EnsureStr):
         if not dataset.is_installed():
             return self
 
-        choices = (
+        # siblings are declared in the Git config, the (expensive) sibling
+        # query only needs to be repeated when it was modified
+        try:
+            cfg_stat = (dataset.repo.dot_git / 'config').stat()
+            cfg_state = (cfg_stat.st_mtime_ns, cfg_stat.st_size)
+        except OSError:
+            cfg_state = None
+        cached = self._dataset_constraints.get(dataset.path)
+        if cfg_state is not None and cached and cached[0] == cfg_state:
+            return cached[1]
+
+        # dict.fromkeys() to remove any duplicates, while keeping the order
+        choices = dict.fromkeys(
             r['name']
             for r in dataset.siblings(
                 action='query',
@@ -474,16 +524,60 @@ class EnsureDatasetSiblingName(EnsureStr):
             and r['name'] != 'here'
         )
         if self._allow_none:
-            return EnsureChoice(None, *choices)
+            constraint = EnsureChoice(None, *choices)
         else:
-            return EnsureChoice(*choices)
+            constraint = EnsureChoice(*choices)
+        self._dataset_constraints[dataset.path] = (cfg_state, constraint)
+        return constraint
+
+
+@lru_cache(maxsize=64)
+def _get_config_procedure_names(dataset: str or None) -> tuple:
+    """Return the names of all discoverable configuration procedures (cached)
+
+    Procedure discovery scans a number of locations on the file system,
+    and is only performed once per dataset, until the cache is cleared
+    with `EnsureConfigProcedureName.invalidate()`.
+
+    Parameters
+    ----------
+    dataset: str or None
+      Path of a dataset to also discover dataset procedures for.
+    """
+    from datalad.local.run_procedure import RunProcedure
+    return tuple(
+        # strip 'cfg_' prefix, even when reporting, we do not want it
+        # because commands like `create()` put it back themselves
+        r['procedure_name'][4:]
+        for r in RunProcedure.__call__(
+            dataset=dataset,
+            discover=True,
+            return_type='generator',
+            result_renderer='disabled',
+            on_failure='ignore')
+        if r.get('status') == 'ok'
+        and r.get('procedure_name', '').startswith('cfg_')
+    )
 
 
 class EnsureConfigProcedureName(EnsureChoice):
     def __init__(self, allow_none=False):
         self._allow_none = allow_none
-        # all dataset-independent procedures
-        super().__init__(*self._get_choices_())
+        # no choices are given, procedure discovery is expensive and only
+        # done on first access
+        super().__init__()
+
+    # deviating from EnsureChoice, the choices are not stored in an
+    # attribute. Instead the (cached) discovery of the dataset-independent
+    # procedures is consulted on access. The assignment of the (empty)
+    # choices in EnsureChoice.__init__() is ignored
+    @property
+    def _allowed(self):
+        return self._get_choices_()
+
+    @_allowed.setter
+    def _allowed(self, value):
+        pass
 
     def long_description(self):
         return 'value must be the name of a configuration dataset procedure'
@@ -496,22 +590,15 @@ class EnsureConfigProcedureName(EnsureChoice):
             return self
         return EnsureChoice(*self._get_choices_(dataset))
 
+    @classmethod
+    def invalidate(cls):
+        """Discard all discovered procedures, e.g. after a config change"""
+        _get_config_procedure_names.cache_clear()
+
     def _get_choices_(self, dataset: Dataset = None):
-        from datalad.local.run_procedure import RunProcedure
-        for r in RunProcedure.__call__(
-                dataset=dataset,
-                discover=True,
-                return_type='generator',
-                result_renderer='disabled',
-                on_failure='ignore'):
-            if r.get('status') != 'ok' or not r.get(
-                    'procedure_name', '').startswith('cfg_'):
-                continue
-            # strip 'cfg_' prefix, even when reporting, we do not want it
-            # because commands like `create()` put it back themselves
-            yield r['procedure_name'][4:]
-        if self._allow_none:
-            yield None
+        choices = _get_config_procedure_names(
+            dataset.path if dataset else None)
+        return choices + (None,) if self._allow_none else choices
 
 
 class EnsureCredentialName(EnsureChoice):
@@ -536,7 +623,7 @@ class EnsureCredentialName(EnsureChoice):
         if self._allow_new:
             return self._new_constraint(value)
         else:
-            super().__call__(value)
+            return super().__call__(value)
 
     def for_dataset(self, dataset: Dataset):
         if self._allow_new or not dataset.is_installed():
@@ -561,7 +648,8 @@ class EnsureExistingDirectory(Constraint):
         if value is None and self._allow_none:
             return None
 
-        if not Path(value).is_dir():
+        # a plain stat() call, no need for a Path instance
+        if not os.path.isdir(value):
             raise ValueError(
                 f"{value} is not an existing directory")
         return value
@@ -36,7 +36,6 @@ class DataladQtUIBridge(QObject):
     def __init__(self, app):
         super().__init__()
         self._app = app
-        self._conlog = app.get_widget('commandLog')
         # establishing this signal/slot connection is the vehicle
         # with which worker threads can thread-safely send messages
         # to the UI for display
@@ -63,7 +62,7 @@ class DataladQtUIBridge(QObject):
 
     @Slot(str)
     def show_message(self, msg):
-        self._conlog.appendPlainText(msg)
+        self._app.append_log('commandLog', msg)
 
     @Slot(str)
     def get_answer(self, props: dict):
@@ -209,12 +208,7 @@ class GooeyUI(DialogUI):
 
         # TODO handle `cr`, but this could be trickier...
         # handling a non-block addition, may require custom insertion
-        # via cursor, see below for code that would need
-        # to go in DataladQtUIBridge.show_message()
-        #cursor = self._conlog.textCursor()
-        #cursor.insertText(msg)
-        #self._conlog.cursorPositionChanged.emit()
-        #self._conlog.textChanged.emit()
+        # via cursor in DataladQtUIBridge.show_message()
 
     def question(self, text,
                  title=None, choices=None,
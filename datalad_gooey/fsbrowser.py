@@ -52,6 +52,11 @@ class GooeyFilesystemBrowser(QObject):
         # enable dragging items, e.g. onto Path input widgets
         tw.setDragEnabled(True)
 
+        # all rows show a single line of text with an icon of the same
+        # size. declaring this lets the view skip querying the size of
+        # each individual item when laying out and scrolling large
+        # directories
+        tw.setUniformRowHeights(True)
         # disable until set_root() was called
         tw.setDisabled(True)
         self._tree = tw
@@ -515,6 +520,8 @@ class GooeyFilesystemBrowser(QObject):
                 ipath, self._app._open_terminal, context)
 
         if path_type == 'annexed-file':
+            # local import, the editor (and its widgets) are only needed
+            # once a user actually asks for a metadata context menu
             from .annex_metadata import AnnexMetadataEditor
             _add_payload_action(
                 '&Metadata...', (ipath, AnnexMetadataEditor),
@@ -3,7 +3,6 @@
 __docformat__ = 'restructuredtext'
 
 import os
-import stat
 import logging
 from pathlib import Path
 
@@ -202,33 +201,35 @@ def _iterdir(path: Path):
     # figure out the type, as far as we need it
     # right now we do not detect a subdir to be a dataset
     # vs a directory, only directories
-    for c in path.iterdir():
-        if c.name == '.git':
-            # we do not report on this special name
-            continue
-        # c could disappear while this is running. Example: temp files managed
-        # by other processes.
-        try:
-            cmode = c.lstat().st_mode
-        except FileNotFoundError as e:
-            CapturedException(e)
-            continue
-        if stat.S_ISLNK(cmode):
-            ctype = 'symlink'
-        elif stat.S_ISDIR(cmode):
-            ctype = 'directory'
-        else:
-            # the rest is a file
-            # there could be fifos and sockets, etc.
-            # but we do not recognize them here
-            ctype = 'file'
-        props = dict(
-            path=str(c),
-            type=ctype,
-        )
-        if ctype == 'symlink':
-            # could be p.readlink() from PY3.9+
-            props['symlink_target'] = os.readlink(c)
-        if ctype != 'directory':
-            props['state'] = 'untracked'
-        yield props
+    # os.scandir() reports the type of an entry along with its name,
+    # on most platforms no additional stat() call per item is needed
+    with os.scandir(path) as entries:
+        for c in entries:
+            if c.name == '.git':
+                # we do not report on this special name
+                continue
+            # c could disappear while this is running. Example: temp files
+            # managed by other processes.
+            try:
+                if c.is_symlink():
+                    ctype = 'symlink'
+                elif c.is_dir(follow_symlinks=False):
+                    ctype = 'directory'
+                else:
+                    # the rest is a file
+                    # there could be fifos and sockets, etc.
+                    # but we do not recognize them here
+                    ctype = 'file'
+            except FileNotFoundError as e:
+                CapturedException(e)
+                continue
+            props = dict(
+                path=c.path,
+                type=ctype,
+            )
+            if ctype == 'symlink':
+                # could be p.readlink() from PY3.9+
+                props['symlink_target'] = os.readlink(c)
+            if ctype != 'directory':
+                props['state'] = 'untracked'
+            yield props
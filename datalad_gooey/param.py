@@ -24,7 +24,9 @@ from .constraints import (
     NoConstraint,
 )
 from .utils import _NoValue
-from .active_suite import spec as active_suite
+from .active_suite import (
+    parameter_display_names as suite_parameter_display_names,
+)
 
 
 class GooeyCommandParameter(QObject):
@@ -134,7 +136,7 @@ class GooeyCommandParameter(QObject):
         display_name = api_overrides.get(
             pname,
             # fallback to API specific override
-            active_suite.get('parameter_display_names', {}).get(
+            suite_parameter_display_names.get(
                 pname,
                 # last resort:
                 # use capitalized original with _ removed as default
@@ -24,7 +24,10 @@ from . import param_widgets as pw
 from .param_path import PathParameter
 from .param_multival import MultiValueParameter
 from .param_alt import AlternativesParameter
-from .active_suite import spec as active_suite
+from .active_suite import (
+    exclude_parameters as suite_exclude_parameters,
+    options as suite_options,
+)
 from .api_utils import (
     get_cmd_params,
     format_param_docs,
@@ -96,7 +99,7 @@ def populate_form_w_params(
                 cmd_api_spec.get(
                     'parameter_order', {}).get(x[0], 99),
                 x[0])):
-        if pname in active_suite.get('exclude_parameters', []):
+        if pname in suite_exclude_parameters:
             continue
         if pname in cmd_api_spec.get('exclude_parameters', []):
             continue
@@ -259,7 +262,7 @@ def _get_parameter(
     # EnsureListOf or EnsureTupleOf and replace them with others
     # otherwise the isinstance() tests below are not valid
 
-    disable_manual_path_input = active_suite.get('options', {}).get(
+    disable_manual_path_input = suite_options.get(
         'disable_manual_path_input', False)
 
     std_param_init_kwargs = dict(
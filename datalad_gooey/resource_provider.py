@@ -29,12 +29,12 @@ class GooeyResources:
         self._resource_path = Path(__file__).resolve().parent / 'resources'
 
     def get_icon(self, name):
-        if name is None:
-            # a NULL icon, like an icon, but without the icon
-            return QIcon()
         icon = self._icons.get(name)
         if icon is None:
-            icon = QIcon(str(self.get_icon_path(name)))
+            icon = QIcon() if name is None \
+                else QIcon(str(self.get_icon_path(name)))
+            # a NULL icon (like an icon, but without the icon) is also
+            # cached, it is requested for any item without a known type
             self._icons[name] = icon
         return icon
 
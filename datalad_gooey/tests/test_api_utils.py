@@ -0,0 +1,22 @@
+from ..api_utils import get_cmd_params
+from ..utils import _NoValue
+
+
+def test_get_cmd_params():
+    def nodefaults(a, b):
+        pass
+
+    def somedefaults(a, b, c=None, *, d='d'):
+        pass
+
+    def alldefaults(a=1, b=2):
+        pass
+
+    def noparams():
+        pass
+
+    assert get_cmd_params(nodefaults) == [('a', _NoValue), ('b', _NoValue)]
+    assert get_cmd_params(somedefaults) == [
+        ('a', _NoValue), ('b', _NoValue), ('c', None), ('d', 'd')]
+    assert get_cmd_params(alldefaults) == [('a', 1), ('b', 2)]
+    assert get_cmd_params(noparams) == []
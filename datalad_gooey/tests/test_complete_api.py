@@ -0,0 +1,87 @@
+import pytest
+
+from .. import complete_api
+from ..complete_api import (
+    _build_api_specs,
+    _get_api_cache_path,
+    _load_api_specs,
+)
+from ..simplified_api import api as simple_api
+
+
+@pytest.fixture(scope="function")
+def api_cache_path(tmp_path, monkeypatch):
+    cache_path = tmp_path / 'gooey' / 'complete_api.json'
+    monkeypatch.setattr(
+        complete_api, '_get_api_cache_path', lambda: cache_path)
+    yield cache_path
+
+
+@pytest.fixture(scope="function")
+def count_builds(monkeypatch):
+    builds = []
+
+    def _fake_build():
+        builds.append(True)
+        return (
+            {'mycmd': {'name': 'Mycmd', 'parameter_order': {'path': 0}}},
+            ['mycmd'],
+        )
+
+    monkeypatch.setattr(complete_api, '_build_api_specs', _fake_build)
+    yield builds
+
+
+def test_api_matches_build(api_cache_path):
+    api, dataset_cmds = _build_api_specs()
+    # cold and warm cache yield the same specification as a build
+    assert _load_api_specs() == (api, dataset_cmds)
+    assert api_cache_path.exists()
+    assert _load_api_specs() == (api, dataset_cmds)
+    # the importable API has the constraints of the simple API merged in
+    for mname, cmd_spec in api.items():
+        simple_cmd_constraints = simple_api.get(
+            mname, {}).get('parameter_constraints')
+        if simple_cmd_constraints:
+            cmd_spec['parameter_constraints'] = simple_cmd_constraints
+    assert complete_api.api == api
+    assert list(complete_api.dataset_api) == dataset_cmds
+
+
+def test_api_cache_reuse(api_cache_path, count_builds):
+    assert not api_cache_path.exists()
+    spec = _load_api_specs()
+    assert len(count_builds) == 1
+    assert api_cache_path.exists()
+    # second load comes from the cache file, no rebuild
+    assert _load_api_specs() == spec
+    assert len(count_builds) == 1
+
+
+def test_api_cache_path(monkeypatch):
+    cache_path = _get_api_cache_path()
+    assert cache_path == _get_api_cache_path()
+    monkeypatch.setattr(complete_api, 'dlversion', '0.0.0-not-a-version')
+    assert _get_api_cache_path() != cache_path
+    monkeypatch.undo()
+    monkeypatch.setattr(
+        complete_api, '_API_CACHE_FORMAT', complete_api._API_CACHE_FORMAT + 1)
+    assert _get_api_cache_path() != cache_path
+
+
+def test_api_cache_broken(api_cache_path, count_builds):
+    api_cache_path.parent.mkdir(parents=True)
+    # corrupt cache
+    api_cache_path.write_text('{"api": {"mycmd"', encoding='utf-8')
+    api, dataset_cmds = _load_api_specs()
+    assert len(count_builds) == 1
+    assert list(api) == dataset_cmds == ['mycmd']
+    # and the corrupt cache was replaced
+    assert _load_api_specs() == (api, dataset_cmds)
+    assert len(count_builds) == 1
+
+    # unreadable cache (also cannot be written), still no crash
+    api_cache_path.unlink()
+    api_cache_path.mkdir()
+    assert _load_api_specs() == (api, dataset_cmds)
+    assert len(count_builds) == 2
@@ -4,6 +4,8 @@ import pathlib
 
 from ..constraints import (
     EnsureBool,
+    EnsureConfigProcedureName,
+    EnsureDatasetSiblingName,
     EnsureInt,
     EnsureMapping,
     EnsureStr,
@@ -167,3 +169,39 @@ def test_EnsureMapping():
             d = constraint(v)
 
     # TODO test for_dataset() once we have a simple EnsurePathInDataset
+
+
+def test_EnsureDatasetSiblingName(tmp_path):
+    from datalad.api import Dataset
+
+    ds = Dataset(tmp_path).create(result_renderer='disabled')
+    c = EnsureDatasetSiblingName(allow_none=True)
+    assert c('') is None
+    assert c('origin') == 'origin'
+    with pytest.raises(ValueError):
+        EnsureDatasetSiblingName()('')
+    dsc = c.for_dataset(ds)
+    assert dsc._allowed == (None,)
+    # same constraint, as long as the siblings did not change
+    assert c.for_dataset(ds) is dsc
+    ds.repo.add_remote('myremote', 'http://example.com')
+    dsc = c.for_dataset(ds)
+    assert dsc._allowed == (None, 'myremote')
+
+
+def test_EnsureConfigProcedureName(tmp_path):
+    from datalad.api import Dataset
+
+    ds = Dataset(tmp_path).create(result_renderer='disabled')
+    # start from a clean slate, other tests could have discovered already
+    EnsureConfigProcedureName.invalidate()
+    c = EnsureConfigProcedureName()
+    assert 'mine' not in c.for_dataset(ds)._allowed
+    procdir = ds.pathobj / '.datalad' / 'procedures'
+    procdir.mkdir(parents=True)
+    (procdir / 'cfg_mine.sh').write_text('#!/bin/sh\n')
+    # discovered procedures are cached
+    assert 'mine' not in c.for_dataset(ds)._allowed
+    # until invalidated
+    EnsureConfigProcedureName.invalidate()
+    assert 'mine' in c.for_dataset(ds)._allowed
@@ -1,7 +1,11 @@
-
-from outdated import check_outdated
 from types import MappingProxyType
 
+from PySide6.QtCore import (
+    QObject,
+    QThreadPool,
+    Signal,
+    Slot,
+)
 from PySide6.QtWidgets import (
     QMessageBox,
     QDialogButtonBox,
@@ -12,28 +16,76 @@ from datalad import (
     __version__ as dlversion,
     cfg as dlcfg,
 )
+from datalad.support.exceptions import CapturedException
 
 from .utils import load_ui
 
+# static parameters for running the diagnostic `wtf` command
+_wtf_kwargs = MappingProxyType(dict(
+    result_renderer='disabled',
+    on_failure='ignore',
+    return_type='generator',
+))
+_wtf_exec_params = MappingProxyType(dict(
+    preferred_result_interval=0.2,
+    result_override=MappingProxyType(dict(
+        secret_handshake=True,
+    )),
+))
+
+
+class _DataladVersionCheck(QObject):
+    """Query PyPI for the latest DataLad version without blocking the UI
+
+    The query runs in a worker thread, the outcome is reported back to the
+    GUI thread via a signal.
+    """
+    # is_outdated, latest version, error message
+    checked = Signal(bool, str, str)
+
+    def __init__(self, app):
+        # parented to the main window to stay alive until the check is done
+        super().__init__(app.main_window)
+        self._app = app
+        self.checked.connect(self._report)
+
+    def start(self):
+        self._app.get_widget('statusbar').showMessage(
+            'Checking latest version', timeout=2000)
+        QThreadPool.globalInstance().start(self._check)
+
+    def _check(self):
+        """The code is executed in a worker thread"""
+        from outdated import check_outdated
+        try:
+            is_outdated, latest = check_outdated('datalad', dlversion)
+        except ValueError:
+            # thrown when one is in a development version (ie., more
+            # recent than the most recent release)
+            self.checked.emit(False, '', '')
+        except Exception as e:
+            self.checked.emit(False, '', CapturedException(e).message)
+        else:
+            self.checked.emit(is_outdated, latest, '')
+
+    @Slot(bool, str, str)
+    def _report(self, is_outdated, latest, error):
+        mbox = QMessageBox.information
+        title = 'Version check'
+        msg = 'Your DataLad version is up to date.'
+        if error:
+            mbox = QMessageBox.warning
+            msg = f'Could not determine the latest DataLad version: {error}'
+        elif is_outdated:
+            mbox = QMessageBox.warning
+            msg = f'A newer DataLad version {latest} ' \
+                  f'is available (installed: {dlversion}).'
+        mbox(self._app.main_window, title, msg)
+        self.deleteLater()
+
 
 def check_new_datalad_version(app):
-    app.get_widget('statusbar').showMessage(
-        'Checking latest version', timeout=2000)
-    try:
-        is_outdated, latest = check_outdated('datalad', dlversion)
-    except ValueError:
-        # thrown when one is in a development version (ie., more
-        # recent than the most recent release)
-        is_outdated = False
-        pass
-    mbox = QMessageBox.information
-    title = 'Version check'
-    msg = 'Your DataLad version is up to date.'
-    if is_outdated:
-        mbox = QMessageBox.warning
-        msg = f'A newer DataLad version {latest} ' \
-              f'is available (installed: {dlversion}).'
-    mbox(app.main_window, title, msg)
+    _DataladVersionCheck(app).start()
 
 
 def get_issue_template(parent):
@@ -73,20 +125,7 @@ def show_about_info(parent):
 
 
 def get_diagnostic_info(app):
-    app.execute_dataladcmd.emit(
-        'wtf',
-        MappingProxyType(dict(
-            result_renderer='disabled',
-            on_failure='ignore',
-            return_type='generator',
-        )),
-        MappingProxyType(dict(
-            preferred_result_interval=0.2,
-            result_override=dict(
-                secret_handshake=True,
-            ),
-        )),
-    )
+    app.execute_dataladcmd.emit('wtf', _wtf_kwargs, _wtf_exec_params)
 
 
 def set_git_identity(parent):
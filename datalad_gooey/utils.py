@@ -1,3 +1,4 @@
+from functools import lru_cache
 import logging
 import os
 import platform
@@ -7,6 +8,8 @@ from typing import Dict
 
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtCore import (
+    QBuffer,
+    QByteArray,
     QFile,
     QIODevice,
     QMimeData,
@@ -31,21 +34,34 @@ class _NoValue:
     pass
 
 
-def load_ui(name, parent=None, custom_widgets=None):
+@lru_cache(maxsize=None)
+def _read_ui(name: str) -> QByteArray:
+    """Return the content of a UI declaration file (cached)"""
     ui_file_name = Path(__file__).parent / 'resources' / 'ui' / f"{name}.ui"
     ui_file = QFile(ui_file_name)
     if not ui_file.open(QIODevice.ReadOnly):
         raise RuntimeError(
             f"Cannot open {ui_file_name}: {ui_file.errorString()}")
+    ui_data = ui_file.readAll()
+    ui_file.close()
+    return ui_data
+
+
+def load_ui(name, parent=None, custom_widgets=None):
+    # the UI declaration is only read from disk once, but a new UI instance
+    # is created on every call
+    ui_buffer = QBuffer()
+    ui_buffer.setData(_read_ui(name))
+    ui_buffer.open(QIODevice.ReadOnly)
     loader = QUiLoader()
     if custom_widgets:
         for custom_widget in custom_widgets:
             loader.registerCustomWidget(custom_widget)
-    ui = loader.load(ui_file, parentWidget=parent)
-    ui_file.close()
+    ui = loader.load(ui_buffer, parentWidget=parent)
+    ui_buffer.close()
     if not ui:
         raise RuntimeError(
-            f"Cannot load UI {ui_file_name}: {loader.errorString()}")
+            f"Cannot load UI {name}: {loader.errorString()}")
     return ui
 
 